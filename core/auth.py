@@ -13,7 +13,7 @@ from starlette.exceptions import HTTPException
 
 from core.config import ROLE_HIERARCHY, USER_ROLES
 from db import get_clubs_in_league, get_match
-from db.clubs import get_all_clubs, get_club
+from db.clubs import get_all_clubs, get_club, iter_all_clubs
 from db.users import (
     get_user_by_id,
     get_user_by_username,
@@ -255,8 +255,7 @@ def get_user_accessible_club_ids(user: dict) -> List[int]:
     if user.get("is_superuser"):
         # Superuser can access all clubs
 
-        clubs = get_all_clubs()
-        return [club["id"] for club in clubs]
+        return [club["id"] for club in iter_all_clubs()]
     else:
         return get_user_club_ids(user["id"])
 
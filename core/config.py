@@ -4,6 +4,10 @@ import os
 
 os.makedirs("data", exist_ok=True)
 DB_PATH = "data/football_manager.db"
+# FM_INMEMORY_DB=1 keeps the whole database in memory (shared across threads)
+# for throwaway demo or dev runs; nothing is written to disk
+if os.environ.get("FM_INMEMORY_DB") == "1":
+    DB_PATH = "file:football_manager?mode=memory&cache=shared"
 
 # Technical Attributes (ordered as in screenshot)
 TECHNICAL_ATTRS = {
@@ -5,6 +5,7 @@ from db.club_leagues import (
     get_clubs_in_league,
     get_league_ids_for_clubs,
     get_leagues_for_club,
+    is_any_club_in_league,
     is_club_in_league,
     remove_club_from_league,
 )
@@ -14,9 +15,10 @@ from db.clubs import (
     get_all_clubs,
     get_club,
     get_club_by_name,
+    iter_all_clubs,
     update_club,
 )
-from db.connection import get_db, init_db
+from db.connection import analyze_db, close_db, get_db, init_db, optimize_db
 from db.leagues import (
     create_league,
     delete_league,
@@ -29,16 +31,21 @@ from db.leagues import (
 )
 from db.match_events import (
     add_match_event,
+    add_match_events,
     delete_match_event,
     get_match_events,
+    iter_match_events,
 )
 from db.match_players import (
     add_match_player,
+    add_match_players,
     get_match_players,
+    get_match_players_by_team,
     get_match_signup_players,
     remove_all_match_signup_players,
     remove_match_player,
     swap_match_players,
+    unassign_match_players,
     update_match_player,
 )
 from db.match_recordings import (
@@ -74,15 +81,19 @@ from db.matches import (
 from db.players import (
     add_player,
     add_player_with_score,
+    add_players,
+    add_players_with_score,
     delete_player,
     find_player_by_name_or_alias,
     get_all_players,
+    get_all_players_light,
     reset_teams,
     swap_players,
     update_player_attrs,
     update_player_height_weight,
     update_player_name,
     update_player_team,
+    update_player_teams,
 )
 from db.settings import get_setting, set_setting
 from db.users import (
@@ -100,16 +111,23 @@ __all__ = [
     # Connection
     "init_db",
     "get_db",
+    "close_db",
+    "analyze_db",
+    "optimize_db",
     # Settings
     "get_setting",
     "set_setting",
     # Players
     "get_all_players",
+    "get_all_players_light",
     "find_player_by_name_or_alias",
     "add_player",
     "add_player_with_score",
+    "add_players",
+    "add_players_with_score",
     "delete_player",
     "update_player_team",
+    "update_player_teams",
     "update_player_attrs",
     "update_player_name",
     "update_player_height_weight",
@@ -148,15 +166,20 @@ __all__ = [
     "delete_match_team",
     # Match Players
     "get_match_players",
+    "get_match_players_by_team",
     "get_match_signup_players",
     "add_match_player",
+    "add_match_players",
     "update_match_player",
+    "unassign_match_players",
     "remove_match_player",
     "remove_all_match_signup_players",
     "swap_match_players",
     # Match Events
     "get_match_events",
+    "iter_match_events",
     "add_match_event",
+    "add_match_events",
     "delete_match_event",
     # Match Recordings
     "get_match_recordings",
@@ -177,6 +200,7 @@ __all__ = [
     "get_club",
     "get_club_by_name",
     "get_all_clubs",
+    "iter_all_clubs",
     "update_club",
     "delete_club",
     # Club-Leagues
@@ -186,4 +210,5 @@ __all__ = [
     "get_leagues_for_club",
     "get_league_ids_for_clubs",
     "is_club_in_league",
+    "is_any_club_in_league",
 ]
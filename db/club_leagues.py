@@ -1,6 +1,8 @@
 # db/club_leagues.py - Club-League relationship operations
 
+import json
 import logging
+import sqlite3
 
 from core.exceptions import DatabaseError, IntegrityError
 from db.connection import get_db
@@ -21,12 +23,19 @@ def add_club_to_league(club_id: int, league_id: int) -> bool:
     """
     try:
         with db_transaction("add_club_to_league") as conn:
-            conn.execute(
-                "INSERT INTO club_leagues (club_id, league_id) VALUES (?, ?)",
+            # OR IGNORE turns "already in league" into rowcount 0 instead of
+            # an IntegrityError and rollback
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO club_leagues (club_id, league_id) VALUES (?, ?)",
                 (club_id, league_id),
             )
             conn.commit()
-            logger.debug(f"Club {club_id} added to league {league_id}")
+            if cursor.rowcount == 0:
+                logger.warning(
+                    f"Failed to add club {club_id} to league {league_id}: Club already in league"
+                )
+                return False
+            logger.debug("Club %s added to league %s", club_id, league_id)
             return True
     except IntegrityError:
         logger.warning(
@@ -62,7 +71,7 @@ def remove_club_from_league(club_id: int, league_id: int) -> bool:
                     f"Remove club from league: Club {club_id} not in league {league_id}"
                 )
                 return False
-            logger.debug(f"Club {club_id} removed from league {league_id}")
+            logger.debug("Club %s removed from league %s", club_id, league_id)
             return True
     except DatabaseError:
         logger.error(
@@ -93,25 +102,26 @@ def get_clubs_in_league(league_id: int) -> list[dict]:
     return [dict(club) for club in clubs]
 
 
-def get_leagues_for_club(club_id: int) -> list[dict]:
+def get_leagues_for_club(club_id: int) -> list[sqlite3.Row]:
     """Get all leagues a club participates in.
 
     Args:
         club_id: ID of the club
 
     Returns:
-        list[dict]: List of league dictionaries
+        list[sqlite3.Row]: List of league rows (key-indexable)
     """
     conn = get_db()
     leagues = conn.execute(
-        """SELECT l.* FROM leagues l
+        """SELECT l.id, l.name, l.description, l.is_public, l.created_at
+           FROM leagues l
            JOIN club_leagues cl ON l.id = cl.league_id
            WHERE cl.club_id = ?
            ORDER BY l.name""",
         (club_id,),
     ).fetchall()
     conn.close()
-    return [dict(league) for league in leagues]
+    return leagues
 
 
 def get_league_ids_for_clubs(club_ids: list[int]) -> list[int]:
@@ -126,10 +136,13 @@ def get_league_ids_for_clubs(club_ids: list[int]) -> list[int]:
     if not club_ids:
         return []
     conn = get_db()
-    placeholders = ",".join("?" * len(club_ids))
-    query = f"""SELECT DISTINCT league_id FROM club_leagues
-                WHERE club_id IN ({placeholders})"""
-    league_ids = conn.execute(query, tuple(club_ids)).fetchall()
+    # Bind the IDs as one JSON array so the statement text is the same for any
+    # number of clubs and never runs into SQLite's bound-parameter limit
+    league_ids = conn.execute(
+        """SELECT DISTINCT league_id FROM club_leagues
+           WHERE club_id IN (SELECT value FROM json_each(?))""",
+        (json.dumps(club_ids),),
+    ).fetchall()
     conn.close()
     return [row["league_id"] for row in league_ids]
 
@@ -146,8 +159,30 @@ def is_club_in_league(club_id: int, league_id: int) -> bool:
     """
     conn = get_db()
     result = conn.execute(
-        "SELECT 1 FROM club_leagues WHERE club_id = ? AND league_id = ?",
+        "SELECT EXISTS(SELECT 1 FROM club_leagues WHERE club_id = ? AND league_id = ?)",
         (club_id, league_id),
     ).fetchone()
     conn.close()
-    return result is not None
+    return bool(result[0])
+
+
+def is_any_club_in_league(club_ids: list[int], league_id: int) -> bool:
+    """Check if any of the given clubs is in a league, in a single query.
+
+    Args:
+        club_ids: List of club IDs
+        league_id: ID of the league
+
+    Returns:
+        bool: True if at least one club is in the league, False otherwise
+    """
+    if not club_ids:
+        return False
+    conn = get_db()
+    result = conn.execute(
+        """SELECT EXISTS(SELECT 1 FROM club_leagues
+           WHERE league_id = ? AND club_id IN (SELECT value FROM json_each(?)))""",
+        (league_id, json.dumps(club_ids)),
+    ).fetchone()
+    conn.close()
+    return bool(result[0])
@@ -1,14 +1,59 @@
 # db/clubs.py - Club database operations
 
 import logging
-from typing import Optional
+import sqlite3
+import threading
+from typing import Iterator, Optional
 
 from core.exceptions import DatabaseError, IntegrityError
+from db import connection
 from db.connection import get_db
 from db.error_handling import db_transaction
 
 logger = logging.getLogger(__name__)
 
+# Clubs are read on almost every request and rarely change, so get_club and
+# get_club_by_name cache rows by id and by name. Writers in this module clear
+# the cache after committing.
+_club_cache_lock = threading.Lock()
+_club_by_id: dict[int, dict] = {}
+_club_by_name: dict[str, dict] = {}
+# Bumped on every invalidation so a read that raced a write is not cached
+_club_cache_generation = 0
+
+
+def _cache_club(club: dict, generation: int) -> None:
+    """Store a club row in both caches unless a write happened since the read.
+
+    Rows read inside a db_transaction block may not be committed yet, so they
+    are not cached.
+    """
+    if connection.transaction_depth() > 0:
+        return
+    with _club_cache_lock:
+        if generation == _club_cache_generation:
+            _club_by_id[club["id"]] = club
+            _club_by_name[club["name"]] = club
+
+
+def clear_club_cache() -> None:
+    """Drop every cached club, e.g. when switching to another database."""
+    global _club_cache_generation
+    with _club_cache_lock:
+        _club_cache_generation += 1
+        _club_by_id.clear()
+        _club_by_name.clear()
+
+
+def _invalidate_club_cache() -> None:
+    """Drop all cached clubs after a write.
+
+    Clears again when the outermost transaction ends, since a nested block's
+    commit only takes effect then.
+    """
+    clear_club_cache()
+    connection.after_transaction(clear_club_cache)
+
 
 def create_club(name: str, description: str = "") -> Optional[int]:
     """Create a new club.
@@ -23,11 +68,10 @@ def create_club(name: str, description: str = "") -> Optional[int]:
     """
     try:
         with db_transaction("create_club") as conn:
-            cursor = conn.execute(
-                "INSERT INTO clubs (name, description) VALUES (?, ?)",
+            club_id = conn.execute(
+                "INSERT INTO clubs (name, description) VALUES (?, ?) RETURNING id",
                 (name, description),
-            )
-            club_id = cursor.lastrowid
+            ).fetchone()[0]
             conn.commit()
             logger.info(f"Club '{name}' created successfully with ID: {club_id}")
             return club_id
@@ -50,10 +94,21 @@ def get_club(club_id: int) -> Optional[dict]:
     Returns:
         dict: Club dictionary if found, None otherwise
     """
+    cached = _club_by_id.get(club_id)
+    if cached is not None:
+        return dict(cached)
+
+    generation = _club_cache_generation
     conn = get_db()
-    club = conn.execute("SELECT * FROM clubs WHERE id = ?", (club_id,)).fetchone()
+    club = conn.execute(
+        "SELECT id, name, description, created_at FROM clubs WHERE id = ?", (club_id,)
+    ).fetchone()
     conn.close()
-    return dict(club) if club else None
+    if not club:
+        return None
+    club = dict(club)
+    _cache_club(club, generation)
+    return dict(club)
 
 
 def get_club_by_name(name: str) -> Optional[dict]:
@@ -65,22 +120,52 @@ def get_club_by_name(name: str) -> Optional[dict]:
     Returns:
         dict: Club dictionary if found, None otherwise
     """
+    cached = _club_by_name.get(name)
+    if cached is not None:
+        return dict(cached)
+
+    generation = _club_cache_generation
     conn = get_db()
-    club = conn.execute("SELECT * FROM clubs WHERE name = ?", (name,)).fetchone()
+    club = conn.execute(
+        "SELECT id, name, description, created_at FROM clubs WHERE name = ?", (name,)
+    ).fetchone()
     conn.close()
-    return dict(club) if club else None
+    if not club:
+        return None
+    club = dict(club)
+    _cache_club(club, generation)
+    return dict(club)
 
 
-def get_all_clubs() -> list[dict]:
+def get_all_clubs() -> list[sqlite3.Row]:
     """Get all clubs.
 
     Returns:
-        list[dict]: List of all club dictionaries
+        list[sqlite3.Row]: List of all club rows (key-indexable)
     """
     conn = get_db()
-    clubs = conn.execute("SELECT * FROM clubs ORDER BY created_at DESC").fetchall()
+    clubs = conn.execute(
+        "SELECT id, name, description, created_at FROM clubs ORDER BY created_at DESC"
+    ).fetchall()
     conn.close()
-    return [dict(club) for club in clubs]
+    return clubs
+
+
+def iter_all_clubs() -> Iterator[sqlite3.Row]:
+    """Iterate over all clubs without building a list.
+
+    Rows are read from the cursor as the caller consumes them.
+
+    Yields:
+        sqlite3.Row: Club rows, newest first (key-indexable)
+    """
+    conn = get_db()
+    try:
+        yield from conn.execute(
+            "SELECT id, name, description, created_at FROM clubs ORDER BY created_at DESC"
+        )
+    finally:
+        conn.close()
 
 
 def update_club(
@@ -96,27 +181,18 @@ def update_club(
     Returns:
         bool: True on success, False on error
     """
+    if name is None and description is None:
+        return True  # Nothing to update
+
     try:
         with db_transaction("update_club") as conn:
-            updates = []
-            params = []
-
-            if name is not None:
-                updates.append("name = ?")
-                params.append(name)
-            if description is not None:
-                updates.append("description = ?")
-                params.append(description)
-
-            if not updates:
-                return True  # Nothing to update
-
-            params.append(club_id)
+            # A None argument leaves that column unchanged
             cursor = conn.execute(
-                f"UPDATE clubs SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
+                "UPDATE clubs SET name = COALESCE(?, name), description = COALESCE(?, description) WHERE id = ?",
+                (name, description, club_id),
             )
             conn.commit()
+            _invalidate_club_cache()
             if cursor.rowcount == 0:
                 logger.warning(f"Update club: No club found with ID {club_id}")
                 return False
@@ -143,6 +219,7 @@ def delete_club(club_id: int) -> bool:
         with db_transaction("delete_club") as conn:
             cursor = conn.execute("DELETE FROM clubs WHERE id = ?", (club_id,))
             conn.commit()
+            _invalidate_club_cache()
             if cursor.rowcount == 0:
                 logger.warning(f"Delete club: No club found with ID {club_id}")
                 return False
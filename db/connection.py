@@ -3,18 +3,169 @@
 import logging
 import os
 import sqlite3
+import threading
+import time
 
 from core.config import DB_PATH
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning applied once when a thread opens its connection.
+# init_db() switches the database file to WAL (the mode persists in the file),
+# which lets readers run alongside a writer; with synchronous=NORMAL it only
+# syncs on checkpoints instead of on every commit. mmap_size lets reads come
+# straight from the OS page cache instead of a read() call per page (ignored
+# for in-memory databases). The page size is left at SQLite's 4096 default.
+#
+# These limits apply per connection, and every request thread keeps its
+# connection for the life of the process (the server's threadpool can run up
+# to 40 threads). The page cache grows only as pages are read, but each
+# thread may hold up to cache_size of private memory, so it is kept at 16 MB.
+# The mmap is address space over the database file, backed by the OS page
+# cache that all threads share; it is bounded by the file size, not 256 MB
+# of RAM per thread.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# sqlite3 keeps compiled statements per connection, keyed by SQL text. The db
+# package issues well over a hundred distinct statements (more with the IN-list
+# and dynamic UPDATE variants), so raise the default 128 slots to keep them prepared.
+_STATEMENT_CACHE_SIZE = 256
+
+# Seconds a connection waits on another writer's lock before raising
+# "database is locked" (sqlite3's busy_timeout)
+_BUSY_TIMEOUT = 5.0
+
+# Caps the rows ANALYZE samples per index so refreshing statistics stays cheap
+# as tables grow
+_ANALYSIS_LIMIT = 1000
+
+# A checkpoint cannot finish while another connection is still reading older
+# WAL frames; retry a few times before giving up
+_CHECKPOINT_ATTEMPTS = 3
+_CHECKPOINT_RETRY_DELAY = 1.0
+
+# Each thread keeps one open connection (sqlite3 connections are not shared
+# across threads by default)
+_local = threading.local()
+
+# SQLite allows one writer at a time. Writers in this process queue on this lock
+# (see db_transaction) instead of in SQLite's busy handler, which polls with
+# growing sleeps and can time out with "database is locked" under load. It is
+# re-entrant because a thread's get_db() connection is shared by nested calls.
+write_lock = threading.RLock()
+
+
+# Connection that keeps a shared in-memory database alive (see init_db)
+_memory_anchor = None
+
+
+def _is_memory_db(path: str) -> bool:
+    """Whether DB_PATH names a shared in-memory database URI"""
+    return path.startswith("file:") and "mode=memory" in path
+
+
+def _connect(**kwargs) -> sqlite3.Connection:
+    """Open DB_PATH, which may be a plain file path or a file: URI"""
+    return sqlite3.connect(
+        DB_PATH, timeout=_BUSY_TIMEOUT, uri=DB_PATH.startswith("file:"), **kwargs
+    )
+
+
+def transaction_depth() -> int:
+    """Number of db_transaction blocks open on the current thread"""
+    return getattr(_local, "transaction_depth", 0)
+
+
+def enter_transaction_block() -> bool:
+    """Record that a db_transaction block opened on this thread.
+
+    Returns:
+        bool: True if it is the outermost block on the thread
+    """
+    depth = transaction_depth()
+    _local.transaction_depth = depth + 1
+    return depth == 0
+
+
+def exit_transaction_block() -> None:
+    """Record that a db_transaction block on this thread finished.
+
+    When the outermost block ends, runs the callbacks queued by
+    after_transaction().
+    """
+    depth = transaction_depth() - 1
+    _local.transaction_depth = depth
+    if depth == 0:
+        callbacks = getattr(_local, "after_transaction", None)
+        _local.after_transaction = None
+        for callback in callbacks or ():
+            callback()
+
+
+def after_transaction(callback) -> None:
+    """Run callback once the outermost db_transaction block on this thread ends.
+
+    For work that must follow the real commit, such as clearing a cache: a
+    commit inside a nested block is deferred to the outermost one. Runs
+    callback right away when no block is open.
+    """
+    if transaction_depth() == 0:
+        callback()
+        return
+    if getattr(_local, "after_transaction", None) is None:
+        _local.after_transaction = []
+    _local.after_transaction.append(callback)
+
+
+class _SharedConnection(sqlite3.Connection):
+    """Connection reused by every get_db() call on the same thread.
+
+    close() keeps the handle (and its page cache) open. Like a real close it
+    discards any uncommitted transaction, so callers keep the usual
+    get_db()/commit()/close() pattern. close_db() closes it for real.
+
+    Because the connection is shared, a helper called while a db_transaction
+    block is open would otherwise end the caller's transaction: close() then
+    leaves the transaction alone, and commit() in a nested block is deferred
+    to the outermost one.
+    """
+
+    def commit(self):
+        if transaction_depth() <= 1:
+            super().commit()
+
+    def close(self):
+        if transaction_depth() == 0 and self.in_transaction:
+            self.rollback()
+
 
 def init_db():
     """Initialize database"""
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    global _memory_anchor
+    if _is_memory_db(DB_PATH):
+        # A shared in-memory database is dropped when its last connection
+        # closes; keep one open for the life of the process
+        if _memory_anchor is None or _memory_anchor[0] != DB_PATH:
+            _memory_anchor = (DB_PATH, _connect())
+    else:
+        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = _connect()
     c = conn.cursor()
 
+    # journal_mode is stored in the database file; switch it before the schema
+    # work so the WAL file exists before any request connection opens
+    c.execute("PRAGMA journal_mode = WAL")
+
+    # Python's sqlite3 runs DDL in autocommit mode, so each CREATE on a fresh
+    # database would commit (and sync) on its own; build the schema in one
+    # transaction instead
+    c.execute("BEGIN")
+
     # Users table
     c.execute(
         """CREATE TABLE IF NOT EXISTS users
@@ -49,6 +200,8 @@ def init_db():
                   FOREIGN KEY (club_id) REFERENCES clubs(id) ON DELETE CASCADE,
                   UNIQUE(user_id, club_id))"""
     )
+    # UNIQUE(user_id, club_id) covers lookups by user; this covers club member lists
+    c.execute("CREATE INDEX IF NOT EXISTS idx_user_clubs_club ON user_clubs(club_id)")
 
     c.execute(
         """CREATE TABLE IF NOT EXISTS players
@@ -69,6 +222,10 @@ def init_db():
                   FOREIGN KEY (club_id) REFERENCES clubs(id),
                   UNIQUE(name, club_id))"""
     )
+    # Roster reads filter by club and list newest first
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_players_club ON players(club_id, created_at)"
+    )
 
     # Leagues table (independent entities, not tied to a single club)
     # is_public: when 1, the league's matches are viewable by anonymous (not
@@ -99,6 +256,10 @@ def init_db():
                   FOREIGN KEY (league_id) REFERENCES leagues(id) ON DELETE CASCADE,
                   UNIQUE(club_id, league_id))"""
     )
+    # UNIQUE(club_id, league_id) covers lookups by club; this covers lookups by league
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_club_leagues_league ON club_leagues(league_id, club_id)"
+    )
 
     # Matches table (linked to leagues)
     c.execute(
@@ -114,8 +275,19 @@ def init_db():
                   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                   FOREIGN KEY (league_id) REFERENCES leagues(id))"""
     )
+    # Match listings read newest-first, both per league and across all leagues;
+    # these let SQLite walk the index instead of sorting the whole table
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_matches_league_date ON matches(league_id, date, start_time)"
+    )
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(date, start_time)"
+    )
 
     # Match teams table
+    # Keeps a rowid surrogate key: match_players.team_id and match_events.team_id
+    # reference it. The UNIQUE(match_id, team_number) index already serves the
+    # per-match lookups, so a WITHOUT ROWID layout would gain little.
     c.execute(
         """CREATE TABLE IF NOT EXISTS match_teams
                  (id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -132,6 +304,8 @@ def init_db():
     )
 
     # Match players table (players in a specific match)
+    # The surrogate id is the handle routes and match_teams.captain_id use, so it
+    # stays the primary key; per-match reads go through UNIQUE(match_id, player_id).
     c.execute(
         """CREATE TABLE IF NOT EXISTS match_players
                  (id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -147,6 +321,10 @@ def init_db():
                   FOREIGN KEY (team_id) REFERENCES match_teams(id),
                   UNIQUE(match_id, player_id))"""
     )
+    # Per-player lookups (and the players FK) can't use the (match_id, player_id) key
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_match_players_player ON match_players(player_id)"
+    )
 
     # App settings table (key-value store)
     c.execute(
@@ -169,6 +347,9 @@ def init_db():
                   FOREIGN KEY (player_id) REFERENCES players(id),
                   FOREIGN KEY (team_id) REFERENCES match_teams(id))"""
     )
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_match_events_match ON match_events(match_id, minute)"
+    )
 
     # Match recordings table (video links uploaded after a match)
     c.execute(
@@ -180,13 +361,116 @@ def init_db():
                   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                   FOREIGN KEY (match_id) REFERENCES matches(id) ON DELETE CASCADE)"""
     )
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_match_recordings_match ON match_recordings(match_id)"
+    )
 
     conn.commit()
+
+    # Give the planner statistics for an existing database that has never been
+    # analyzed; after that analyze_db() at shutdown refreshes them as tables
+    # grow. A brand-new database is skipped: stats for empty tables would only
+    # mislead the planner until the next refresh.
+    analyzed = c.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+    ).fetchone()
+    has_data = c.execute(
+        "SELECT EXISTS (SELECT 1 FROM players) OR EXISTS (SELECT 1 FROM matches)"
+    ).fetchone()[0]
+    if analyzed is None and has_data:
+        c.execute(f"PRAGMA analysis_limit = {_ANALYSIS_LIMIT}")
+        c.execute("ANALYZE")
     conn.close()
 
 
 def get_db():
-    """Get database connection"""
-    conn = sqlite3.connect(DB_PATH)
+    """Get the current thread's database connection, opening it on first use"""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == DB_PATH:
+        return conn
+
+    close_db()
+    conn = _connect(
+        factory=_SharedConnection,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    _local.conn = conn
+    _local.path = DB_PATH
     return conn
+
+
+def close_db():
+    """Close the current thread's database connection, if one is open"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        return
+    _local.conn = None
+    sqlite3.Connection.close(conn)
+
+
+def checkpoint_db() -> bool:
+    """Copy every WAL frame into the main database file and truncate the WAL.
+
+    Holds ``write_lock`` so writers in this process do not add frames while
+    it runs. Used before copying the database file, e.g. for a backup.
+
+    Returns:
+        bool: True if the database file now holds every committed change
+    """
+    for attempt in range(_CHECKPOINT_ATTEMPTS):
+        if attempt:
+            time.sleep(_CHECKPOINT_RETRY_DELAY)
+        with write_lock:
+            busy, log_frames, checkpointed = (
+                get_db().execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+            )
+        if not busy and checkpointed == log_frames:
+            return True
+        logger.warning(
+            "WAL checkpoint incomplete (busy=%s, log=%s, checkpointed=%s)",
+            busy,
+            log_frames,
+            checkpointed,
+        )
+    return False
+
+
+def analyze_db():
+    """Refresh the planner statistics of every table; run once at shutdown.
+
+    analysis_limit caps the rows ANALYZE samples per index, so this stays
+    bounded as tables grow, but it still reads every index while holding
+    write_lock.
+    """
+    try:
+        with write_lock:
+            conn = get_db()
+            conn.execute(f"PRAGMA analysis_limit = {_ANALYSIS_LIMIT}")
+            conn.execute("ANALYZE")
+            conn.commit()
+            conn.close()
+    except sqlite3.Error:
+        logger.warning("Refreshing planner statistics failed", exc_info=True)
+
+
+def optimize_db():
+    """Re-analyze tables whose statistics have gone stale, e.g. after an import.
+
+    Runs PRAGMA optimize on this thread's connection. It only considers tables
+    whose statistics that connection's queries relied on, and re-analyzes
+    those whose row count changed a lot since the last ANALYZE;
+    analysis_limit caps the rows sampled, so it is cheap when little has
+    changed.
+    """
+    try:
+        with write_lock:
+            conn = get_db()
+            conn.execute(f"PRAGMA analysis_limit = {_ANALYSIS_LIMIT}")
+            conn.execute("PRAGMA optimize")
+            conn.commit()
+            conn.close()
+    except sqlite3.Error:
+        logger.warning("PRAGMA optimize failed", exc_info=True)
@@ -13,7 +13,12 @@ from functools import wraps
 from typing import Callable, Optional, TypeVar, Union
 
 from core.exceptions import DatabaseError, IntegrityError
-from db.connection import get_db
+from db.connection import (
+    enter_transaction_block,
+    exit_transaction_block,
+    get_db,
+    write_lock,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,13 @@ T = TypeVar("T")
 def db_transaction(operation: str):
     """Context manager for database transactions with automatic rollback on errors.
 
+    Holds ``write_lock`` for the whole block, so writers in this process take
+    turns instead of contending for SQLite's write lock.
+
+    Blocks may nest on one thread. Only the outermost block commits, rolls
+    back and releases the connection; a nested block's commit() is deferred
+    and its errors propagate to the outer block.
+
     Args:
         operation: Name of the operation being performed (for logging)
 
@@ -35,27 +47,41 @@ def db_transaction(operation: str):
             cursor = conn.execute(...)
             conn.commit()
     """
-    conn = get_db()
-    try:
-        yield conn
-    except sqlite3.IntegrityError as e:
-        conn.rollback()
-        logger.warning(f"{operation}: IntegrityError - {e}")
-        raise IntegrityError(
-            message=f"Database integrity constraint violated: {str(e)}",
-            operation=operation,
-            details=str(e),
-        )
-    except sqlite3.Error as e:
-        conn.rollback()
-        logger.error(f"{operation}: Database error - {e}", exc_info=True)
-        raise DatabaseError(f"Database error in {operation}: {str(e)}")
-    except Exception as e:
-        conn.rollback()
-        logger.error(f"{operation}: Unexpected error - {e}", exc_info=True)
-        raise DatabaseError(f"Unexpected error in {operation}: {str(e)}")
-    finally:
-        conn.close()
+    with write_lock:
+        conn = get_db()
+        outermost = enter_transaction_block()
+        try:
+            yield conn
+        except DatabaseError:
+            # Already logged by the nested db_transaction that raised it
+            if outermost:
+                conn.rollback()
+            raise
+        except sqlite3.IntegrityError as e:
+            if outermost:
+                conn.rollback()
+            logger.warning(f"{operation}: IntegrityError - {e}")
+            raise IntegrityError(
+                message=f"Database integrity constraint violated: {str(e)}",
+                operation=operation,
+                details=str(e),
+            )
+        except sqlite3.Error as e:
+            if outermost:
+                conn.rollback()
+            # No traceback here: callers log the DatabaseError with exc_info,
+            # and its chained cause already carries this one
+            logger.error(f"{operation}: Database error - {e}")
+            raise DatabaseError(f"Database error in {operation}: {str(e)}") from e
+        except Exception as e:
+            if outermost:
+                conn.rollback()
+            logger.error(f"{operation}: Unexpected error - {e}")
+            raise DatabaseError(f"Unexpected error in {operation}: {str(e)}") from e
+        finally:
+            exit_transaction_block()
+            if outermost:
+                conn.close()
 
 
 def handle_db_operation(
@@ -1,19 +1,61 @@
 # db/leagues.py - League database operations
 
+import json
 import logging
+import threading
 from typing import Optional
 
 from core.exceptions import DatabaseError, IntegrityError
+from db import connection
 from db.club_leagues import (
     add_club_to_league,
-    get_league_ids_for_clubs,
-    is_club_in_league,
+    is_any_club_in_league,
 )
 from db.connection import get_db
 from db.error_handling import db_transaction
 
 logger = logging.getLogger(__name__)
 
+# Leagues rarely change but are looked up on most match pages. League rows are
+# cached under ("id", league_id), the unfiltered list under "all" and the
+# Friendly league id under "friendly". Writers in this module clear the cache
+# after committing. Club membership checks are not cached.
+_league_cache_lock = threading.Lock()
+_league_cache: dict = {}
+# Bumped on every invalidation so a read that raced a write is not cached
+_league_cache_generation = 0
+
+
+def _cache_league_value(key, value, generation: int) -> None:
+    """Store a value in the cache unless a write happened since it was read.
+
+    Values read inside a db_transaction block may not be committed yet, so
+    they are not cached.
+    """
+    if connection.transaction_depth() > 0:
+        return
+    with _league_cache_lock:
+        if generation == _league_cache_generation:
+            _league_cache[key] = value
+
+
+def clear_league_cache() -> None:
+    """Drop every cached league, e.g. when switching to another database."""
+    global _league_cache_generation
+    with _league_cache_lock:
+        _league_cache_generation += 1
+        _league_cache.clear()
+
+
+def _invalidate_league_cache() -> None:
+    """Drop all cached leagues after a write.
+
+    Clears again when the outermost transaction ends, since a nested block's
+    commit only takes effect then.
+    """
+    clear_league_cache()
+    connection.after_transaction(clear_league_cache)
+
 
 def get_all_leagues(club_ids: Optional[list[int]] = None) -> list[dict]:
     """Get all leagues, optionally filtered by club_ids
@@ -22,24 +64,36 @@ def get_all_leagues(club_ids: Optional[list[int]] = None) -> list[dict]:
         club_ids: If None, returns all leagues. If empty list [], returns empty list.
                  If list with IDs, returns leagues for those clubs.
     """
-    conn = get_db()
     if club_ids is None:
         # No filter - return all leagues (for superusers)
-        leagues = conn.execute(
-            "SELECT * FROM leagues ORDER BY created_at DESC"
-        ).fetchall()
-    elif len(club_ids) == 0:
+        cached = _league_cache.get("all")
+        if cached is None:
+            generation = _league_cache_generation
+            conn = get_db()
+            cached = tuple(
+                dict(league)
+                for league in conn.execute(
+                    "SELECT id, name, description, is_public, created_at FROM leagues ORDER BY created_at DESC"
+                )
+            )
+            conn.close()
+            _cache_league_value("all", cached, generation)
+        return [dict(league) for league in cached]
+
+    if len(club_ids) == 0:
         # Empty list - user has no clubs, return empty
-        leagues = []
-    else:
-        # Get leagues that the clubs participate in
-        league_ids = get_league_ids_for_clubs(club_ids)
-        if league_ids:
-            placeholders = ",".join("?" * len(league_ids))
-            query = f"SELECT * FROM leagues WHERE id IN ({placeholders}) ORDER BY created_at DESC"
-            leagues = conn.execute(query, tuple(league_ids)).fetchall()
-        else:
-            leagues = []
+        return []
+
+    # Leagues that the clubs participate in. The IDs are bound as one JSON
+    # array so the statement text is the same for any number of clubs.
+    conn = get_db()
+    leagues = conn.execute(
+        """SELECT id, name, description, is_public, created_at FROM leagues
+           WHERE id IN (SELECT league_id FROM club_leagues
+                        WHERE club_id IN (SELECT value FROM json_each(?)))
+           ORDER BY created_at DESC""",
+        (json.dumps(club_ids),),
+    ).fetchall()
     conn.close()
     return [dict(league) for league in leagues]
 
@@ -52,7 +106,7 @@ def get_public_leagues() -> list[dict]:
     """
     conn = get_db()
     leagues = conn.execute(
-        "SELECT * FROM leagues WHERE is_public = 1 ORDER BY name"
+        "SELECT id, name, description, is_public, created_at FROM leagues WHERE is_public = 1 ORDER BY name"
     ).fetchall()
     conn.close()
     return [dict(league) for league in leagues]
@@ -68,19 +122,27 @@ def get_league(league_id: int, club_ids: Optional[list[int]] = None) -> Optional
     Returns:
         dict: League dictionary if found and accessible, None otherwise
     """
-    conn = get_db()
-    league = conn.execute("SELECT * FROM leagues WHERE id = ?", (league_id,)).fetchone()
-    conn.close()
+    league = _league_cache.get(("id", league_id))
+    if league is None:
+        generation = _league_cache_generation
+        conn = get_db()
+        league = conn.execute(
+            "SELECT id, name, description, is_public, created_at FROM leagues WHERE id = ?",
+            (league_id,),
+        ).fetchone()
+        conn.close()
 
-    if not league:
-        return None
+        if not league:
+            return None
+
+        league = dict(league)
+        _cache_league_value(("id", league_id), league, generation)
 
     league_dict = dict(league)
 
     # If club_ids provided, check if any of the clubs participate in this league
     if club_ids is not None and len(club_ids) > 0:
-        has_access = any(is_club_in_league(cid, league_id) for cid in club_ids)
-        if not has_access:
+        if not is_any_club_in_league(club_ids, league_id):
             return None
 
     return league_dict
@@ -94,29 +156,34 @@ def get_or_create_friendly_league(club_id: int) -> int:
 
     Returns:
         int: League ID of the Friendly league
-    """
-    conn = get_db()
-    # Try to find existing Friendly league
-    league = conn.execute("SELECT * FROM leagues WHERE name = 'Friendly'").fetchone()
-
-    if league:
-        league_id = dict(league)["id"]
-        # Make sure club is in the league
-        add_club_to_league(club_id, league_id)
-        conn.close()
-        return league_id
-
-    # Create Friendly league if it doesn't exist
-    cursor = conn.execute(
-        "INSERT INTO leagues (name, description) VALUES (?, ?)",
-        ("Friendly", "Friendly matches"),
-    )
-    league_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-
-    # Add club to the league
 
+    Raises:
+        DatabaseError: If the league could not be read or created
+    """
+    league_id = _league_cache.get("friendly")
+    if league_id is None:
+        generation = _league_cache_generation
+        with db_transaction("get_or_create_friendly_league") as conn:
+            league = conn.execute(
+                "SELECT id FROM leagues WHERE name = 'Friendly'"
+            ).fetchone()
+            if league is None:
+                # INSERT OR IGNORE lets another process that creates the league
+                # first win the UNIQUE name without failing; read back the row
+                conn.execute(
+                    "INSERT OR IGNORE INTO leagues (name, description) VALUES (?, ?)",
+                    ("Friendly", "Friendly matches"),
+                )
+                conn.commit()
+                _invalidate_league_cache()
+                generation = _league_cache_generation
+                league = conn.execute(
+                    "SELECT id FROM leagues WHERE name = 'Friendly'"
+                ).fetchone()
+        league_id = league[0]
+        _cache_league_value("friendly", league_id, generation)
+
+    # Make sure club is in the league
     add_club_to_league(club_id, league_id)
 
     return league_id
@@ -141,6 +208,7 @@ def create_league(name: str, description: str = "") -> Optional[int]:
             )
             league_id = cursor.lastrowid
             conn.commit()
+            _invalidate_league_cache()
             logger.info(f"League '{name}' created successfully with ID: {league_id}")
             return league_id
     except IntegrityError:
@@ -166,31 +234,22 @@ def update_league(
     Returns:
         bool: True on success, False on error
     """
+    if name is None and description is None:
+        return True  # Nothing to update
+
     try:
         with db_transaction("update_league") as conn:
-            updates = []
-            params = []
-
-            if name is not None:
-                updates.append("name = ?")
-                params.append(name)
-            if description is not None:
-                updates.append("description = ?")
-                params.append(description)
-
-            if not updates:
-                return True  # Nothing to update
-
-            params.append(league_id)
+            # A None argument leaves that column unchanged
             cursor = conn.execute(
-                f"UPDATE leagues SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
+                "UPDATE leagues SET name = COALESCE(?, name), description = COALESCE(?, description) WHERE id = ?",
+                (name, description, league_id),
             )
             conn.commit()
+            _invalidate_league_cache()
             if cursor.rowcount == 0:
                 logger.warning(f"Update league: No league found with ID {league_id}")
                 return False
-            logger.debug(f"League {league_id} updated successfully")
+            logger.debug("League %s updated successfully", league_id)
             return True
     except IntegrityError:
         logger.warning(f"Failed to update league {league_id}: IntegrityError")
@@ -221,6 +280,7 @@ def set_league_public(league_id: int, is_public: bool) -> bool:
                 (1 if is_public else 0, league_id),
             )
             conn.commit()
+            _invalidate_league_cache()
             if cursor.rowcount == 0:
                 logger.warning(
                     f"Set league public: No league found with ID {league_id}"
@@ -234,7 +294,7 @@ def set_league_public(league_id: int, is_public: bool) -> bool:
 
 
 def delete_league(league_id: int) -> bool:
-    """Delete a league (cascade deletes matches).
+    """Delete a league. Its matches are left in place (foreign keys are off).
 
     Args:
         league_id: ID of the league to delete
@@ -246,6 +306,7 @@ def delete_league(league_id: int) -> bool:
         with db_transaction("delete_league") as conn:
             cursor = conn.execute("DELETE FROM leagues WHERE id = ?", (league_id,))
             conn.commit()
+            _invalidate_league_cache()
             if cursor.rowcount == 0:
                 logger.warning(f"Delete league: No league found with ID {league_id}")
                 return False
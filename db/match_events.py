@@ -1,7 +1,8 @@
 # db/match_events.py - Match event database operations
 
 import logging
-from typing import Optional
+import sqlite3
+from typing import Iterable, Iterator, Optional
 
 from core.exceptions import DatabaseError
 from db.connection import get_db
@@ -19,18 +20,35 @@ def get_match_events(match_id: int) -> list[dict]:
     Returns:
         list[dict]: List of event dictionaries
     """
+    return [dict(event) for event in iter_match_events(match_id)]
+
+
+def iter_match_events(match_id: int) -> Iterator[sqlite3.Row]:
+    """Iterate over a match's events without building a list.
+
+    Rows are read from the cursor as the caller consumes them.
+
+    Args:
+        match_id: ID of the match
+
+    Yields:
+        sqlite3.Row: Event rows ordered by minute, with player_name and
+        team_name (key-indexable)
+    """
     conn = get_db()
-    events = conn.execute(
-        """SELECT e.*, p.name as player_name, mt.team_name
-           FROM match_events e
-           LEFT JOIN players p ON e.player_id = p.id
-           LEFT JOIN match_teams mt ON e.team_id = mt.id
-           WHERE e.match_id = ?
-           ORDER BY e.minute""",
-        (match_id,),
-    ).fetchall()
-    conn.close()
-    return [dict(event) for event in events]
+    try:
+        yield from conn.execute(
+            """SELECT e.id, e.match_id, e.event_type, e.player_id, e.team_id, e.minute,
+                      e.description, p.name as player_name, mt.team_name
+               FROM match_events e
+               LEFT JOIN players p ON e.player_id = p.id
+               LEFT JOIN match_teams mt ON e.team_id = mt.id
+               WHERE e.match_id = ?
+               ORDER BY e.minute""",
+            (match_id,),
+        )
+    finally:
+        conn.close()
 
 
 def add_match_event(
@@ -64,7 +82,10 @@ def add_match_event(
             event_id = cursor.lastrowid
             conn.commit()
             logger.debug(
-                f"Match event added: event_id={event_id}, match_id={match_id}, type={event_type}"
+                "Match event added: event_id=%s, match_id=%s, type=%s",
+                event_id,
+                match_id,
+                event_type,
             )
             return event_id
     except DatabaseError:
@@ -72,6 +93,35 @@ def add_match_event(
         return None
 
 
+def add_match_events(
+    match_id: int,
+    rows: Iterable[tuple[str, Optional[int], Optional[int], Optional[int], str]],
+) -> int:
+    """Add several events to a match in a single transaction.
+
+    Args:
+        match_id: ID of the match
+        rows: Iterable of (event_type, player_id, team_id, minute, description)
+              tuples, matching add_match_event's arguments
+
+    Returns:
+        int: Number of events added (0 on error)
+    """
+    try:
+        with db_transaction("add_match_events") as conn:
+            cursor = conn.executemany(
+                "INSERT INTO match_events (match_id, event_type, player_id, team_id, minute, description) VALUES (?, ?, ?, ?, ?, ?)",
+                ((match_id, *row) for row in rows),
+            )
+            added = cursor.rowcount
+            conn.commit()
+            logger.debug("Added %s events to match %s", added, match_id)
+            return added
+    except DatabaseError:
+        logger.error(f"Failed to add match events to match {match_id}", exc_info=True)
+        return 0
+
+
 def delete_match_event(event_id: int) -> bool:
     """Delete a match event.
 
@@ -88,7 +138,7 @@ def delete_match_event(event_id: int) -> bool:
             if cursor.rowcount == 0:
                 logger.warning(f"Delete match event: No event found with ID {event_id}")
                 return False
-            logger.debug(f"Match event {event_id} deleted successfully")
+            logger.debug("Match event %s deleted successfully", event_id)
             return True
     except DatabaseError:
         logger.error(f"Failed to delete match event {event_id}", exc_info=True)
@@ -1,7 +1,7 @@
 # db/match_players.py - Match player database operations
 
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
 from core.exceptions import DatabaseError, IntegrityError
 from db.connection import get_db
@@ -42,10 +42,41 @@ def get_match_players(match_id: int, team_id: Optional[int] = None) -> list[dict
         ).fetchall()
     conn.close()
 
-    result = []
-    for p in players:
-        result.append(parse_player_attributes(p))
-    return result
+    return [parse_player_attributes(p) for p in players]
+
+
+def get_match_players_by_team(
+    match_id: int, team_ids: Iterable[int]
+) -> dict[int, list[dict]]:
+    """Get a match's team players grouped by team, in a single query.
+
+    Equivalent to calling get_match_players(match_id, team_id) for each team.
+
+    Args:
+        match_id: ID of the match
+        team_ids: IDs of the match's teams
+
+    Returns:
+        dict[int, list[dict]]: Players with parsed attributes for each team id
+                               (an empty list for a team with no players)
+    """
+    players_by_team = {team_id: [] for team_id in team_ids}
+    conn = get_db()
+    players = conn.execute(
+        """SELECT mp.*, p.name, p.technical_attrs, p.mental_attrs, p.physical_attrs, p.gk_attrs
+           FROM match_players mp
+           JOIN players p ON mp.player_id = p.id
+           WHERE mp.match_id = ? AND mp.team_id IS NOT NULL
+           ORDER BY mp.team_id, mp.is_starter DESC, mp.position, p.name""",
+        (match_id,),
+    ).fetchall()
+    conn.close()
+
+    for player in players:
+        team_players = players_by_team.get(player["team_id"])
+        if team_players is not None:
+            team_players.append(parse_player_attributes(player))
+    return players_by_team
 
 
 def get_match_signup_players(match_id: int) -> list[dict]:
@@ -68,10 +99,7 @@ def get_match_signup_players(match_id: int) -> list[dict]:
     ).fetchall()
     conn.close()
 
-    result = []
-    for p in players:
-        result.append(parse_player_attributes(p))
-    return result
+    return [parse_player_attributes(p) for p in players]
 
 
 def add_match_player(
@@ -118,6 +146,37 @@ def add_match_player(
         return None
 
 
+def add_match_players(
+    match_id: int,
+    rows: Iterable[tuple[int, Optional[int], Optional[str], int, Optional[str]]],
+) -> int:
+    """Add several players to a match in a single transaction.
+
+    Players already in the match are skipped rather than failing the batch.
+
+    Args:
+        match_id: ID of the match
+        rows: Iterable of (player_id, team_id, position, is_starter,
+              tactical_position) tuples, matching add_match_player's arguments
+
+    Returns:
+        int: Number of players added (0 on error)
+    """
+    try:
+        with db_transaction("add_match_players") as conn:
+            cursor = conn.executemany(
+                "INSERT OR IGNORE INTO match_players (match_id, player_id, team_id, position, is_starter, tactical_position) VALUES (?, ?, ?, ?, ?, ?)",
+                ((match_id, *row) for row in rows),
+            )
+            added = cursor.rowcount
+            conn.commit()
+            logger.debug(f"Added {added} players to match {match_id}")
+            return added
+    except DatabaseError:
+        logger.error(f"Error adding players to match {match_id}", exc_info=True)
+        return 0
+
+
 # Sentinel object to distinguish between "not provided" and "set to NULL"
 _UNSET = object()
 
@@ -143,61 +202,25 @@ def update_match_player(
     Returns:
         bool: True on success, False on error
     """
+    # _UNSET means "not provided"; None binds as NULL
+    fields = (
+        ("team_id", team_id),
+        ("position", position),
+        ("tactical_position", tactical_position),
+        ("is_starter", is_starter),
+        ("rating", rating),
+    )
+    columns = [column for column, value in fields if value is not _UNSET]
+    if not columns:
+        return True  # Nothing to update
+    values = [value for _, value in fields if value is not _UNSET]
+    values.append(match_player_id)
+
     try:
         with db_transaction("update_match_player") as conn:
-            updates = []
-            values = []
-
-            # Handle team_id - _UNSET means "not provided", None means "set to NULL"
-            if team_id is not _UNSET:
-                if team_id is None:
-                    updates.append("team_id = NULL")
-                else:
-                    updates.append("team_id = ?")
-                    values.append(team_id)
-
-            # Handle position
-            if position is not _UNSET:
-                if position is None:
-                    updates.append("position = NULL")
-                else:
-                    updates.append("position = ?")
-                    values.append(position)
-
-            # Handle tactical_position
-            if tactical_position is not _UNSET:
-                if tactical_position is None:
-                    updates.append("tactical_position = NULL")
-                else:
-                    updates.append("tactical_position = ?")
-                    values.append(tactical_position)
-
-            # Handle is_starter
-            if is_starter is not _UNSET:
-                updates.append("is_starter = ?")
-                values.append(is_starter)
-
-            # Handle rating
-            if rating is not _UNSET:
-                updates.append("rating = ?")
-                values.append(rating)
-
-            if not updates:
-                return True  # Nothing to update
-
-            # Build SQL with proper handling of NULL values
-            sql_updates = []
-            sql_values = []
-            for update in updates:
-                if "NULL" in update:
-                    sql_updates.append(update)
-                else:
-                    sql_updates.append(update)
-                    sql_values.append(values.pop(0))
-            sql_values.append(match_player_id)
             cursor = conn.execute(
-                f"UPDATE match_players SET {', '.join(sql_updates)} WHERE id = ?",
-                sql_values,
+                f"UPDATE match_players SET {' = ?, '.join(columns)} = ? WHERE id = ?",
+                values,
             )
             conn.commit()
             if cursor.rowcount == 0:
@@ -239,6 +262,40 @@ def remove_match_player(match_player_id: int) -> bool:
         return False
 
 
+def unassign_match_players(match_id: int, team_id: Optional[int] = None) -> bool:
+    """Move match players back to the signup pool in a single statement.
+
+    Clears team_id and position and marks players as non-starters, the same
+    as calling update_match_player on each of them.
+
+    Args:
+        match_id: ID of the match
+        team_id: Only unassign players from this team; None unassigns every team
+
+    Returns:
+        bool: True on success, False on error
+    """
+    if team_id is None:
+        sql = "UPDATE match_players SET team_id = NULL, position = NULL, is_starter = 0 WHERE match_id = ? AND team_id IS NOT NULL"
+        params = (match_id,)
+    else:
+        sql = "UPDATE match_players SET team_id = NULL, position = NULL, is_starter = 0 WHERE match_id = ? AND team_id = ?"
+        params = (match_id, team_id)
+    try:
+        with db_transaction("unassign_match_players") as conn:
+            cursor = conn.execute(sql, params)
+            conn.commit()
+            logger.debug(
+                f"Unassigned {cursor.rowcount} players from teams in match {match_id}"
+            )
+            return True
+    except DatabaseError:
+        logger.error(
+            f"Failed to unassign players from teams in match {match_id}", exc_info=True
+        )
+        return False
+
+
 def remove_all_match_signup_players(match_id: int) -> bool:
     """Remove all signup players (players with team_id = NULL) from a match.
 
@@ -278,36 +335,33 @@ def swap_match_players(match_player1_id: int, match_player2_id: int) -> bool:
     """
     try:
         with db_transaction("swap_match_players") as conn:
-            # Get both match players
-            p1 = conn.execute(
-                "SELECT team_id, position, tactical_position, is_starter FROM match_players WHERE id = ?",
-                (match_player1_id,),
-            ).fetchone()
-            p2 = conn.execute(
-                "SELECT team_id, position, tactical_position, is_starter FROM match_players WHERE id = ?",
-                (match_player2_id,),
-            ).fetchone()
-
-            if not p1:
-                logger.warning(
-                    f"Swap match players: Match player {match_player1_id} not found"
-                )
-                return False
-            if not p2:
+            # One UPDATE ... FROM (SQLite 3.33+): each target row takes the
+            # team_id, position, tactical_position and is_starter of the other.
+            # If either id is missing neither row matches, so rowcount is 0.
+            cursor = conn.execute(
+                """UPDATE match_players AS mp
+                   SET team_id = other.team_id, position = other.position,
+                       tactical_position = other.tactical_position,
+                       is_starter = other.is_starter
+                   FROM (SELECT ? AS target_id, team_id, position, tactical_position, is_starter
+                         FROM match_players WHERE id = ?
+                         UNION ALL
+                         SELECT ?, team_id, position, tactical_position, is_starter
+                         FROM match_players WHERE id = ?) AS other
+                   WHERE mp.id = other.target_id""",
+                (
+                    match_player1_id,
+                    match_player2_id,
+                    match_player2_id,
+                    match_player1_id,
+                ),
+            )
+            if cursor.rowcount == 0:
                 logger.warning(
-                    f"Swap match players: Match player {match_player2_id} not found"
+                    f"Swap match players: Match player {match_player1_id} or {match_player2_id} not found"
                 )
                 return False
 
-            # Swap their team_id, position, tactical_position, and is_starter
-            conn.execute(
-                "UPDATE match_players SET team_id = ?, position = ?, tactical_position = ?, is_starter = ? WHERE id = ?",
-                (p2[0], p2[1], p2[2], p2[3], match_player1_id),
-            )
-            conn.execute(
-                "UPDATE match_players SET team_id = ?, position = ?, tactical_position = ?, is_starter = ? WHERE id = ?",
-                (p1[0], p1[1], p1[2], p1[3], match_player2_id),
-            )
             conn.commit()
             logger.debug(
                 f"Swapped teams/positions/tactical_positions for match players {match_player1_id} and {match_player2_id}"
@@ -21,7 +21,7 @@ def get_match_teams(match_id: int) -> list[dict]:
     """
     conn = get_db()
     teams = conn.execute(
-        "SELECT * FROM match_teams WHERE match_id = ? ORDER BY team_number",
+        "SELECT id, match_id, team_number, team_name, jersey_color, score, captain_id, should_allocate FROM match_teams WHERE match_id = ? ORDER BY team_number",
         (match_id,),
     ).fetchall()
     conn.close()
@@ -50,42 +50,30 @@ def create_match_team(
     """
     try:
         with db_transaction("create_match_team") as conn:
-            cursor = conn.execute(
+            # RETURNING yields the id on both the INSERT and the DO UPDATE path.
+            # lastrowid is not usable here: on the update path it still holds
+            # whatever row this connection inserted last.
+            team_id = conn.execute(
                 """INSERT INTO match_teams (match_id, team_number, team_name, jersey_color, should_allocate) VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT (match_id, team_number) DO UPDATE SET team_name = ?, jersey_color = ?, should_allocate = ?""",
-                (
-                    match_id,
-                    team_number,
-                    team_name,
-                    jersey_color,
-                    should_allocate,
-                    team_name,
-                    jersey_color,
-                    should_allocate,
-                ),
-            )
+                ON CONFLICT (match_id, team_number) DO UPDATE SET team_name = excluded.team_name,
+                    jersey_color = excluded.jersey_color, should_allocate = excluded.should_allocate
+                RETURNING id""",
+                (match_id, team_number, team_name, jersey_color, should_allocate),
+            ).fetchone()[0]
             conn.commit()
 
-            # After INSERT or UPDATE, get the team_id
-            # If it was an INSERT, lastrowid will have the new ID
-            # If it was an UPDATE (ON CONFLICT), we need to query for the existing ID
-            team_id = cursor.lastrowid
-            if not team_id or team_id == 0:
-                # ON CONFLICT was triggered, query for existing team_id
-                result = conn.execute(
-                    "SELECT id FROM match_teams WHERE match_id = ? AND team_number = ?",
-                    (match_id, team_number),
-                ).fetchone()
-                if result:
-                    team_id = result[0]
-
             logger.debug(
-                f"Match team created/updated: team_id={team_id}, match_id={match_id}, team_number={team_number}"
+                "Match team created/updated: team_id=%s, match_id=%s, team_number=%s",
+                team_id,
+                match_id,
+                team_number,
             )
             return team_id
     except DatabaseError:
         logger.error(
-            f"Error creating match team (match_id={match_id}, team_number={team_number})",
+            "Error creating match team (match_id=%s, team_number=%s)",
+            match_id,
+            team_number,
             exc_info=True,
         )
         return None
@@ -114,31 +102,15 @@ def update_match_team(
     """
     try:
         with db_transaction("update_match_team") as conn:
-            # Build update query dynamically based on which fields are provided
-            updates = []
-            params = []
-
-            updates.append("team_name = ?")
-            params.append(team_name)
-            updates.append("jersey_color = ?")
-            params.append(jersey_color)
-
-            if score is not None:
-                updates.append("score = ?")
-                params.append(score)
-
-            if captain_id is not None:
-                updates.append("captain_id = ?")
-                params.append(captain_id)
-
-            if should_allocate is not None:
-                updates.append("should_allocate = ?")
-                params.append(should_allocate)
-
-            params.append(team_id)
+            # A None optional argument leaves that column unchanged, so every
+            # call runs the same statement
             cursor = conn.execute(
-                f"UPDATE match_teams SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
+                """UPDATE match_teams SET team_name = ?, jersey_color = ?,
+                       score = COALESCE(?, score),
+                       captain_id = COALESCE(?, captain_id),
+                       should_allocate = COALESCE(?, should_allocate)
+                   WHERE id = ?""",
+                (team_name, jersey_color, score, captain_id, should_allocate, team_id),
             )
             conn.commit()
             if cursor.rowcount == 0:
@@ -1,17 +1,27 @@
 # db/matches.py - Match database operations
 
+import json
 import logging
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
 from core.exceptions import DatabaseError, IntegrityError
-from db.club_leagues import get_league_ids_for_clubs, is_club_in_league
+from db.club_leagues import get_league_ids_for_clubs
 from db.connection import get_db
 from db.error_handling import db_transaction
 from db.leagues import get_all_leagues, get_or_create_friendly_league
 
 logger = logging.getLogger(__name__)
 
+# Match reads name their columns instead of using *, so they keep returning
+# the same shape if the table grows. _M_MATCH_COLUMNS is the form for
+# queries that alias matches as m.
+_MATCH_COLUMNS = (
+    "id, league_id, date, start_time, end_time, location, num_teams, "
+    "max_players_per_team, created_at"
+)
+_M_MATCH_COLUMNS = ", ".join(f"m.{column}" for column in _MATCH_COLUMNS.split(", "))
+
 
 def _build_match_query_with_league(
     where_clause: str = "", params: tuple = (), limit: Optional[int] = None
@@ -26,7 +36,7 @@ def _build_match_query_with_league(
     Returns:
         tuple: (query_string, params_tuple)
     """
-    query = """SELECT m.*, l.name as league_name
+    query = f"""SELECT {_M_MATCH_COLUMNS}, l.name as league_name
                FROM matches m
                LEFT JOIN leagues l ON m.league_id = l.id"""
     if where_clause:
@@ -47,15 +57,11 @@ def get_match_info() -> Optional[Dict[str, Any]]:
     """
     conn = get_db()
     try:
+        # start_time is also exposed as time for backward compatibility
         match = conn.execute(
-            "SELECT * FROM matches ORDER BY date DESC, start_time DESC LIMIT 1"
+            f"SELECT {_MATCH_COLUMNS}, start_time AS time FROM matches ORDER BY date DESC, start_time DESC LIMIT 1"
         ).fetchone()
-        if match:
-            match_dict = dict(match)
-            # Convert start_time to time for backward compatibility
-            match_dict["time"] = match_dict.get("start_time", "")
-            return match_dict
-        return None
+        return dict(match) if match else None
     finally:
         conn.close()
 
@@ -72,10 +78,13 @@ def save_match_info(date: str, time: str, location: str, club_id: int) -> None:
         time: Match start time
         location: Match location
         club_id: Club ID to associate with Friendly league
+
+    Raises:
+        DatabaseError: If the match could not be saved
     """
     friendly_league_id = get_or_create_friendly_league(club_id)
-    conn = get_db()
-    try:
+    # The delete and insert commit together under the write lock
+    with db_transaction("save_match_info") as conn:
         # Delete old matches without league_id (if any)
         conn.execute("DELETE FROM matches WHERE league_id IS NULL")
         # Create new match
@@ -84,8 +93,6 @@ def save_match_info(date: str, time: str, location: str, club_id: int) -> None:
             (friendly_league_id, date, time, location),
         )
         conn.commit()
-    finally:
-        conn.close()
 
 
 def get_matches_by_league(league_id: int) -> List[Dict[str, Any]]:
@@ -100,7 +107,7 @@ def get_matches_by_league(league_id: int) -> List[Dict[str, Any]]:
     conn = get_db()
     try:
         matches = conn.execute(
-            "SELECT * FROM matches WHERE league_id = ? ORDER BY date DESC, start_time DESC",
+            f"SELECT {_MATCH_COLUMNS} FROM matches WHERE league_id = ? ORDER BY date DESC, start_time DESC",
             (league_id,),
         ).fetchall()
         return [dict(match) for match in matches]
@@ -178,7 +185,7 @@ def get_next_match_by_league(league_id: int) -> Optional[Dict[str, Any]]:
         where_clause = (
             "m.league_id = ? AND ((m.date > ?) OR (m.date = ? AND m.start_time >= ?))"
         )
-        query = """SELECT m.*, l.name as league_name
+        query = f"""SELECT {_M_MATCH_COLUMNS}, l.name as league_name
                    FROM matches m
                    LEFT JOIN leagues l ON m.league_id = l.id"""
         query += f" WHERE {where_clause}"
@@ -203,13 +210,39 @@ def get_next_matches_by_all_leagues(
     """
     # Get leagues that the clubs participate in
     leagues = get_all_leagues(club_ids)
-    next_matches = {}
+    if not leagues:
+        return {}
 
+    # Same "upcoming" rule and ordering as get_next_match_by_league, but the
+    # soonest match of every league comes back from one query
+    today = date.today().isoformat()
+    now = datetime.now().strftime("%H:%M:%S")
+    conn = get_db()
+    try:
+        rows = conn.execute(
+            f"""SELECT {_MATCH_COLUMNS}, league_name FROM (
+                   SELECT {_M_MATCH_COLUMNS}, l.name as league_name,
+                          ROW_NUMBER() OVER (
+                              PARTITION BY m.league_id
+                              ORDER BY m.date ASC, m.start_time ASC
+                          ) AS league_rank
+                   FROM matches m
+                   LEFT JOIN leagues l ON m.league_id = l.id
+                   WHERE m.league_id IN (SELECT value FROM json_each(?))
+                     AND ((m.date > ?) OR (m.date = ? AND m.start_time >= ?))
+               ) WHERE league_rank = 1""",
+            (json.dumps([league["id"] for league in leagues]), today, today, now),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    matches_by_league = {row["league_id"]: dict(row) for row in rows}
+
+    next_matches = {}
     for league in leagues:
-        league_id = league["id"]
-        match = get_next_match_by_league(league_id)
+        match = matches_by_league.get(league["id"])
         if match:
-            next_matches[league_id] = {"league": league, "match": match}
+            next_matches[league["id"]] = {"league": league, "match": match}
 
     return next_matches
 
@@ -248,7 +281,7 @@ def get_last_created_match() -> Optional[Dict[str, Any]]:
     conn = get_db()
     try:
         # Note: This query uses created_at for ordering, not date/start_time
-        query = """SELECT m.*, l.name as league_name
+        query = f"""SELECT {_M_MATCH_COLUMNS}, l.name as league_name
                    FROM matches m
                    LEFT JOIN leagues l ON m.league_id = l.id
                    ORDER BY m.created_at DESC LIMIT 1"""
@@ -286,18 +319,18 @@ def get_recent_matches(
     conn = get_db()
     try:
         if club_ids is not None and len(club_ids) > 0:
-            # Limit to leagues that the clubs participate in.
-            league_ids = get_league_ids_for_clubs(club_ids)
-            if not league_ids:
-                return []
-            placeholders = ",".join("?" * len(league_ids))
-            where_clause = f"m.league_id IN ({placeholders}) AND {past_clause}"
-            params = tuple(league_ids) + past_params + (limit,)
+            # Limit to leagues that the clubs participate in. The club IDs are
+            # bound as one JSON array so the statement text never varies.
+            where_clause = f"""m.league_id IN (
+                   SELECT league_id FROM club_leagues
+                   WHERE club_id IN (SELECT value FROM json_each(?)))
+                 AND {past_clause}"""
+            params = (json.dumps(club_ids),) + past_params + (limit,)
         else:
             where_clause = past_clause
             params = past_params + (limit,)
 
-        query = f"""SELECT m.*, l.name as league_name
+        query = f"""SELECT {_M_MATCH_COLUMNS}, l.name as league_name
                    FROM matches m
                    LEFT JOIN leagues l ON m.league_id = l.id
                    WHERE {where_clause}
@@ -322,23 +355,24 @@ def get_match(
     """
     conn = get_db()
     try:
+        # The club access check runs in the same query: a match outside the
+        # clubs' leagues is simply not returned. Matches without a league
+        # are visible to everyone.
+        check_clubs = club_ids is not None and len(club_ids) > 0
         match = conn.execute(
-            "SELECT * FROM matches WHERE id = ?", (match_id,)
+            f"""SELECT {_M_MATCH_COLUMNS} FROM matches m
+               WHERE m.id = ?
+                 AND (? = 0 OR COALESCE(m.league_id, 0) = 0 OR EXISTS (
+                     SELECT 1 FROM club_leagues cl
+                     WHERE cl.league_id = m.league_id
+                       AND cl.club_id IN (SELECT value FROM json_each(?))))""",
+            (match_id, int(check_clubs), json.dumps(club_ids or [])),
         ).fetchone()
 
         if not match:
             return None
 
-        match_dict = dict(match)
-
-        # If club_ids provided, check if any of the clubs participate in this league
-        if club_ids is not None and len(club_ids) > 0 and match_dict.get("league_id"):
-            league_id = match_dict["league_id"]
-            has_access = any(is_club_in_league(cid, league_id) for cid in club_ids)
-            if not has_access:
-                return None
-
-        return match_dict
+        return dict(match)
     finally:
         conn.close()
 
@@ -490,7 +524,7 @@ def get_last_match_by_league(league_id: int) -> Optional[Dict[str, Any]]:
     conn = get_db()
     try:
         match = conn.execute(
-            "SELECT * FROM matches WHERE league_id = ? ORDER BY date DESC, start_time DESC LIMIT 1",
+            f"SELECT {_MATCH_COLUMNS} FROM matches WHERE league_id = ? ORDER BY date DESC, start_time DESC LIMIT 1",
             (league_id,),
         ).fetchone()
         return dict(match) if match else None
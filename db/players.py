@@ -1,9 +1,11 @@
 # db/players.py - Player database operations
 
-import json
 import logging
 import random
-from typing import Optional
+import sqlite3
+from typing import Iterable, Optional
+
+import orjson
 
 from core.config import GK_ATTRS, MENTAL_ATTRS, PHYSICAL_ATTRS, TECHNICAL_ATTRS
 from core.exceptions import DatabaseError, IntegrityError
@@ -12,6 +14,22 @@ from db.error_handling import db_transaction
 
 logger = logging.getLogger(__name__)
 
+# JSON-encoded attribute columns on the players table
+_ATTR_COLUMNS = ("technical_attrs", "mental_attrs", "physical_attrs", "gk_attrs")
+
+# Attribute keys frozen at import so the generators don't re-walk the dicts
+_TECH_KEYS = tuple(TECHNICAL_ATTRS)
+_MENTAL_KEYS = tuple(MENTAL_ATTRS)
+_PHYS_KEYS = tuple(PHYSICAL_ATTRS)
+_GK_KEYS = tuple(GK_ATTRS)
+_N_TECH = len(_TECH_KEYS)
+_N_MENTAL = len(_MENTAL_KEYS)
+_N_PHYS = len(_PHYS_KEYS)
+_N_GK = len(_GK_KEYS)
+
+# Attribute values are drawn from the 1-20 scale
+_ATTR_RANGE = range(1, 21)
+
 
 def generate_random_attrs() -> dict[str, int]:
     """Generate random attributes (1-20 scale).
@@ -19,7 +37,7 @@ def generate_random_attrs() -> dict[str, int]:
     Returns:
         dict[str, int]: Dictionary of technical attributes with random values (1-20)
     """
-    return {key: random.randint(1, 20) for key in TECHNICAL_ATTRS.keys()}
+    return dict(zip(_TECH_KEYS, random.choices(_ATTR_RANGE, k=_N_TECH)))
 
 
 def generate_random_mental() -> dict[str, int]:
@@ -28,7 +46,7 @@ def generate_random_mental() -> dict[str, int]:
     Returns:
         dict[str, int]: Dictionary of mental attributes with random values (1-20)
     """
-    return {key: random.randint(1, 20) for key in MENTAL_ATTRS.keys()}
+    return dict(zip(_MENTAL_KEYS, random.choices(_ATTR_RANGE, k=_N_MENTAL)))
 
 
 def generate_random_physical() -> dict[str, int]:
@@ -37,7 +55,7 @@ def generate_random_physical() -> dict[str, int]:
     Returns:
         dict[str, int]: Dictionary of physical attributes with random values (1-20)
     """
-    return {key: random.randint(1, 20) for key in PHYSICAL_ATTRS.keys()}
+    return dict(zip(_PHYS_KEYS, random.choices(_ATTR_RANGE, k=_N_PHYS)))
 
 
 def generate_random_gk() -> dict[str, int]:
@@ -46,7 +64,19 @@ def generate_random_gk() -> dict[str, int]:
     Returns:
         dict[str, int]: Dictionary of goalkeeper attributes with random values (1-20)
     """
-    return {key: random.randint(1, 20) for key in GK_ATTRS.keys()}
+    return dict(zip(_GK_KEYS, random.choices(_ATTR_RANGE, k=_N_GK)))
+
+
+def _dump_attrs(attrs: dict) -> str:
+    """Serialize an attribute dictionary for a players JSON column.
+
+    Args:
+        attrs: Attribute name to value mapping
+
+    Returns:
+        str: Compact JSON text (stored as TEXT, not BLOB)
+    """
+    return orjson.dumps(attrs).decode()
 
 
 def parse_player_attributes(player_row: dict) -> dict:
@@ -60,10 +90,9 @@ def parse_player_attributes(player_row: dict) -> dict:
         dict: Player dict with parsed attribute dictionaries
     """
     player_dict = dict(player_row)
-    player_dict["technical_attrs"] = json.loads(player_row["technical_attrs"] or "{}")
-    player_dict["mental_attrs"] = json.loads(player_row["mental_attrs"] or "{}")
-    player_dict["physical_attrs"] = json.loads(player_row["physical_attrs"] or "{}")
-    player_dict["gk_attrs"] = json.loads(player_row["gk_attrs"] or "{}")
+    loads = orjson.loads
+    for column in _ATTR_COLUMNS:
+        player_dict[column] = loads(player_dict[column] or "{}")
     return player_dict
 
 
@@ -87,11 +116,41 @@ def get_all_players(club_ids: Optional[list[int]] = None) -> list[dict]:
         ).fetchall()
     conn.close()
 
-    result = []
-    for p in players:
-        result.append(parse_player_attributes(p))
+    return [parse_player_attributes(p) for p in players]
 
-    return result
+
+def get_all_players_light(
+    club_ids: Optional[list[int]] = None,
+) -> list[sqlite3.Row]:
+    """Get all players without their attribute columns.
+
+    For views that only need identity and team assignment; skips reading and
+    parsing the four JSON attribute columns.
+
+    Args:
+        club_ids: Optional list of club IDs to filter by
+
+    Returns:
+        list[sqlite3.Row]: Rows with id, name, alias, club_id, position_pref,
+            team and position
+    """
+    columns = "id, name, alias, club_id, position_pref, team, position"
+    conn = get_db()
+    if club_ids:
+        # The IDs are bound as one JSON array so the statement text is the
+        # same for any number of clubs
+        players = conn.execute(
+            f"""SELECT {columns} FROM players
+                WHERE club_id IN (SELECT value FROM json_each(?))
+                ORDER BY created_at DESC""",
+            (orjson.dumps(club_ids).decode(),),
+        ).fetchall()
+    else:
+        players = conn.execute(
+            f"SELECT {columns} FROM players ORDER BY created_at DESC"
+        ).fetchall()
+    conn.close()
+    return players
 
 
 def find_player_by_name_or_alias(
@@ -138,10 +197,10 @@ def add_player(
     """
     try:
         with db_transaction("add_player") as conn:
-            technical = json.dumps(generate_random_attrs())
-            mental = json.dumps(generate_random_mental())
-            physical = json.dumps(generate_random_physical())
-            gk = json.dumps(generate_random_gk())
+            technical = _dump_attrs(generate_random_attrs())
+            mental = _dump_attrs(generate_random_mental())
+            physical = _dump_attrs(generate_random_physical())
+            gk = _dump_attrs(generate_random_gk())
 
             cursor = conn.execute(
                 "INSERT INTO players (name, club_id, position_pref, alias, technical_attrs, mental_attrs, physical_attrs, gk_attrs) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
@@ -163,6 +222,61 @@ def add_player(
         return None
 
 
+def _random_attr_blocks(count: int):
+    """Yield serialized random attribute columns for ``count`` players.
+
+    All values are drawn in one ``random.choices`` call and sliced per player,
+    rather than four draws per player.
+
+    Yields:
+        tuple[str, str, str, str]: technical, mental, physical and gk JSON
+    """
+    t_end = _N_TECH
+    m_end = t_end + _N_MENTAL
+    p_end = m_end + _N_PHYS
+    width = p_end + _N_GK
+    values = random.choices(_ATTR_RANGE, k=count * width)
+    for start in range(0, count * width, width):
+        block = values[start : start + width]
+        yield (
+            _dump_attrs(dict(zip(_TECH_KEYS, block[:t_end]))),
+            _dump_attrs(dict(zip(_MENTAL_KEYS, block[t_end:m_end]))),
+            _dump_attrs(dict(zip(_PHYS_KEYS, block[m_end:p_end]))),
+            _dump_attrs(dict(zip(_GK_KEYS, block[p_end:]))),
+        )
+
+
+def add_players(names: list[str], club_id: int) -> int:
+    """Add several players with random attributes in a single transaction.
+
+    Names that already exist in the club are skipped.
+
+    Args:
+        names: Player names to add
+        club_id: ID of the club the players belong to
+
+    Returns:
+        int: Number of players added (0 on error)
+    """
+    rows = (
+        (name, club_id, "", *attrs)
+        for name, attrs in zip(names, _random_attr_blocks(len(names)))
+    )
+    try:
+        with db_transaction("add_players") as conn:
+            cursor = conn.executemany(
+                "INSERT OR IGNORE INTO players (name, club_id, position_pref, technical_attrs, mental_attrs, physical_attrs, gk_attrs) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = cursor.rowcount
+            conn.commit()
+            logger.info(f"Added {added} players to club {club_id}")
+            return added
+    except DatabaseError:
+        logger.error(f"Failed to add players to club {club_id}", exc_info=True)
+        return 0
+
+
 def add_player_with_score(
     name: str,
     club_id: int,
@@ -188,10 +302,10 @@ def add_player_with_score(
     try:
         attrs = set_overall_score(overall_score)
         with db_transaction("add_player_with_score") as conn:
-            technical = json.dumps(attrs["technical"])
-            mental = json.dumps(attrs["mental"])
-            physical = json.dumps(attrs["physical"])
-            gk = json.dumps(attrs["gk"])
+            technical = _dump_attrs(attrs["technical"])
+            mental = _dump_attrs(attrs["mental"])
+            physical = _dump_attrs(attrs["physical"])
+            gk = _dump_attrs(attrs["gk"])
 
             cursor = conn.execute(
                 "INSERT INTO players (name, club_id, position_pref, alias, technical_attrs, mental_attrs, physical_attrs, gk_attrs) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
@@ -238,6 +352,49 @@ def delete_player(player_id: int) -> bool:
         return False
 
 
+def add_players_with_score(
+    players: list[tuple[str, int]], club_id: int
+) -> list[Optional[int]]:
+    """Add several players with score-derived attributes in one transaction.
+
+    Args:
+        players: (name, overall_score) pairs
+        club_id: ID of the club the players belong to
+
+    Returns:
+        list[Optional[int]]: New player ID for each input pair, in order;
+            None where the name already exists in the club. All None on error.
+    """
+    from logic.scoring import set_overall_score
+
+    sql = "INSERT OR IGNORE INTO players (name, club_id, position_pref, technical_attrs, mental_attrs, physical_attrs, gk_attrs) VALUES (?, ?, '', ?, ?, ?, ?)"
+    try:
+        with db_transaction("add_players_with_score") as conn:
+            player_ids = []
+            for name, overall_score in players:
+                attrs = set_overall_score(overall_score)
+                cursor = conn.execute(
+                    sql,
+                    (
+                        name,
+                        club_id,
+                        _dump_attrs(attrs["technical"]),
+                        _dump_attrs(attrs["mental"]),
+                        _dump_attrs(attrs["physical"]),
+                        _dump_attrs(attrs["gk"]),
+                    ),
+                )
+                player_ids.append(cursor.lastrowid if cursor.rowcount else None)
+            conn.commit()
+            logger.info(
+                f"Created {sum(pid is not None for pid in player_ids)} players with scores in club {club_id}"
+            )
+            return player_ids
+    except DatabaseError:
+        logger.error(f"Failed to add players to club {club_id}", exc_info=True)
+        return [None] * len(players)
+
+
 def update_player_team(player_id: int, team: str, position: str) -> bool:
     """Update player team and position.
 
@@ -270,6 +427,29 @@ def update_player_team(player_id: int, team: str, position: str) -> bool:
         return False
 
 
+def update_player_teams(assignments: Iterable[tuple[int, str, str]]) -> bool:
+    """Update team and position for several players in a single transaction.
+
+    Args:
+        assignments: Iterable of (player_id, team, position) tuples
+
+    Returns:
+        bool: True on success, False on error
+    """
+    rows = [(team, position, player_id) for player_id, team, position in assignments]
+    try:
+        with db_transaction("update_player_teams") as conn:
+            conn.executemany(
+                "UPDATE players SET team = ?, position = ? WHERE id = ?", rows
+            )
+            conn.commit()
+            logger.debug(f"Updated team for {len(rows)} players")
+            return True
+    except DatabaseError:
+        logger.error("Failed to update player teams", exc_info=True)
+        return False
+
+
 def update_player_attrs(
     player_id: int,
     tech_attrs: dict,
@@ -294,10 +474,10 @@ def update_player_attrs(
             cursor = conn.execute(
                 "UPDATE players SET technical_attrs = ?, mental_attrs = ?, physical_attrs = ?, gk_attrs = ? WHERE id = ?",
                 (
-                    json.dumps(tech_attrs),
-                    json.dumps(mental_attrs),
-                    json.dumps(phys_attrs),
-                    json.dumps(gk_attrs),
+                    _dump_attrs(tech_attrs),
+                    _dump_attrs(mental_attrs),
+                    _dump_attrs(phys_attrs),
+                    _dump_attrs(gk_attrs),
                     player_id,
                 ),
             )
@@ -403,31 +583,23 @@ def swap_players(player1_id: int, player2_id: int) -> bool:
     """
     try:
         with db_transaction("swap_players") as conn:
-            # Get both players
-            p1 = conn.execute(
-                "SELECT team, position FROM players WHERE id = ?", (player1_id,)
-            ).fetchone()
-            p2 = conn.execute(
-                "SELECT team, position FROM players WHERE id = ?", (player2_id,)
-            ).fetchone()
-
-            if not p1:
-                logger.warning(f"Swap players: Player {player1_id} not found")
-                return False
-            if not p2:
-                logger.warning(f"Swap players: Player {player2_id} not found")
-                return False
-
-            # Swap their team and position
-            conn.execute(
-                "UPDATE players SET team = ?, position = ? WHERE id = ?",
-                (p2[0], p2[1], player1_id),
-            )
-            conn.execute(
-                "UPDATE players SET team = ?, position = ? WHERE id = ?",
-                (p1[0], p1[1], player2_id),
+            # The FROM subquery is evaluated before any row is written, so each
+            # player picks up the other's original team and position
+            cursor = conn.execute(
+                """UPDATE players SET team = other.team, position = other.position
+                   FROM (SELECT id, team, position FROM players WHERE id IN (:p1, :p2)) AS other
+                   WHERE players.id IN (:p1, :p2)
+                     AND other.id = CASE players.id WHEN :p1 THEN :p2 ELSE :p1 END""",
+                {"p1": player1_id, "p2": player2_id},
             )
             conn.commit()
+
+            # A missing player leaves the other without a partner row to copy from
+            if cursor.rowcount == 0:
+                logger.warning(
+                    f"Swap players: Player {player1_id} or {player2_id} not found"
+                )
+                return False
             logger.debug(
                 f"Swapped teams/positions for players {player1_id} and {player2_id}"
             )
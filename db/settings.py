@@ -3,6 +3,7 @@
 import sqlite3
 
 from db.connection import get_db
+from db.error_handling import db_transaction
 
 
 def get_setting(key, default=None):
@@ -21,12 +22,9 @@ def get_setting(key, default=None):
 
 def set_setting(key, value):
     """Set a setting value (upsert)."""
-    conn = get_db()
-    try:
+    with db_transaction("set_setting") as conn:
         conn.execute(
             "INSERT OR REPLACE INTO app_settings (key, value) VALUES (?, ?)",
             (key, value),
         )
         conn.commit()
-    finally:
-        conn.close()
@@ -210,6 +210,37 @@ def update_user_club_role(user_id: int, club_id: int, role: str) -> bool:
         return False
 
 
+def remove_user_from_club(user_id: int, club_id: int) -> bool:
+    """Remove a user's membership of a club.
+
+    Args:
+        user_id: ID of the user
+        club_id: ID of the club
+
+    Returns:
+        bool: True on success, False on error
+    """
+    try:
+        with db_transaction("remove_user_from_club") as conn:
+            cursor = conn.execute(
+                "DELETE FROM user_clubs WHERE user_id = ? AND club_id = ?",
+                (user_id, club_id),
+            )
+            conn.commit()
+            if cursor.rowcount == 0:
+                logger.warning(
+                    f"Remove user from club: No matching record found for user_id={user_id}, club_id={club_id}"
+                )
+                return False
+            logger.debug(f"User {user_id} removed from club {club_id}")
+            return True
+    except DatabaseError:
+        logger.error(
+            f"Failed to remove user {user_id} from club {club_id}", exc_info=True
+        )
+        return False
+
+
 def update_last_login(user_id: int) -> bool:
     """Update the last_login timestamp for a user.
 
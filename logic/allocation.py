@@ -4,14 +4,15 @@ import random
 
 from core.config import ALLOCATION_MAX_ITERATIONS, POSITION_DISTRIBUTION
 from db import (
-    add_match_player,
+    add_match_players,
     get_all_players,
     get_match,
     get_match_players,
     get_match_signup_players,
     get_match_teams,
+    unassign_match_players,
     update_match_player,
-    update_player_team,
+    update_player_teams,
 )
 from logic.scoring import calculate_overall_score, calculate_player_overall
 
@@ -69,8 +70,9 @@ def assign_positions(team, team_num):
 
     positions = positions[:team_size]
 
-    for player, position in zip(team, positions):
-        update_player_team(player["id"], team_num, position)
+    update_player_teams(
+        (player["id"], team_num, position) for player, position in zip(team, positions)
+    )
 
 
 def allocate_match_teams(match_id):
@@ -86,11 +88,7 @@ def allocate_match_teams(match_id):
 
     # First, reset all allocated players back to available (set team_id to NULL)
     # This ensures we start fresh from all signup players
-    for team in teams:
-        team_players = get_match_players(match_id, team["id"])
-        for mp in team_players:
-            # Reset to available (team_id = NULL)
-            update_match_player(mp["id"], team_id=None, position=None, is_starter=0)
+    unassign_match_players(match_id)
 
     # Get all signup players for this match (players with team_id = NULL)
     # This includes both original signups and players just reset from teams
@@ -301,10 +299,8 @@ def assign_match_positions_with_subs(starters, substitutes, team_id, match_id):
     player_to_match_player_id = {mp["player_id"]: mp["id"] for mp in all_match_players}
 
     # Remove all existing players from this team in the match (set team_id to NULL)
-    existing_players = get_match_players(match_id, team_id)
-    for mp in existing_players:
-        # Update to remove from team instead of deleting
-        update_match_player(mp["id"], team_id=None, position=None, is_starter=0)
+    # Update to remove from team instead of deleting
+    unassign_match_players(match_id, team_id)
 
     # Assign positions to starters using formation rules
     random.shuffle(starters)
@@ -391,6 +387,9 @@ def assign_match_positions_with_subs(starters, substitutes, team_id, match_id):
 
     position_tactical_pairs = position_tactical_pairs[:starter_size]
 
+    # Players without a match_player record are inserted in one batch at the end
+    new_rows = []
+
     # Add/update starters to match
     for player, (position, tactical_position) in zip(starters, position_tactical_pairs):
         player_id = player["id"]
@@ -407,14 +406,7 @@ def assign_match_positions_with_subs(starters, substitutes, team_id, match_id):
             )
         else:
             # Create new record
-            add_match_player(
-                match_id,
-                player_id,
-                team_id,
-                position,
-                is_starter=1,
-                tactical_position=tactical_position,
-            )
+            new_rows.append((player_id, team_id, position, 1, tactical_position))
 
     # Assign positions to substitutes
     random.shuffle(substitutes)
@@ -449,4 +441,7 @@ def assign_match_positions_with_subs(starters, substitutes, team_id, match_id):
                 )
             else:
                 # Create new record
-                add_match_player(match_id, player_id, team_id, position, is_starter=0)
+                new_rows.append((player_id, team_id, position, 0, None))
+
+    if new_rows:
+        add_match_players(match_id, new_rows)
@@ -1,6 +1,6 @@
 # logic/import_logic.py - Player import logic
 
-from db import add_player, find_player_by_name_or_alias
+from db import add_players, find_player_by_name_or_alias, optimize_db
 
 
 def parse_signup_text(text):
@@ -33,13 +33,16 @@ def import_players(text, club_id):
         Number of players imported
     """
     player_names = parse_signup_text(text)
-    imported = 0
 
-    for name in player_names:
-        # Check if player exists by name or alias
-        existing_player = find_player_by_name_or_alias(name)
-        if not existing_player:
-            add_player(name, club_id)
-            imported += 1
-
-    return imported
+    # Skip players that already exist by name or alias
+    new_names = [
+        name for name in player_names if not find_player_by_name_or_alias(name)
+    ]
+    if not new_names:
+        return 0
+
+    added = add_players(new_names, club_id)
+    if added:
+        # Cheap: only re-analyzes players if it grew enough to skew the plans
+        optimize_db()
+    return added
@@ -73,13 +73,11 @@ def set_technical_score(score):
     # Scale from category score to attribute average
     avg_value = score / CATEGORY_TO_ATTRIBUTE_SCALE
 
-    result = {}
-    for key in TECHNICAL_ATTRS:
-        result[key] = max(
-            SCORE_RANGES["attribute"][0],
-            min(SCORE_RANGES["attribute"][1], round(avg_value)),
-        )
-    return result
+    value = max(
+        SCORE_RANGES["attribute"][0],
+        min(SCORE_RANGES["attribute"][1], round(avg_value)),
+    )
+    return dict.fromkeys(TECHNICAL_ATTRS, value)
 
 
 def set_mental_score(score):
@@ -88,13 +86,11 @@ def set_mental_score(score):
     # Scale from category score to attribute average
     avg_value = score / CATEGORY_TO_ATTRIBUTE_SCALE
 
-    result = {}
-    for key in MENTAL_ATTRS:
-        result[key] = max(
-            SCORE_RANGES["attribute"][0],
-            min(SCORE_RANGES["attribute"][1], round(avg_value)),
-        )
-    return result
+    value = max(
+        SCORE_RANGES["attribute"][0],
+        min(SCORE_RANGES["attribute"][1], round(avg_value)),
+    )
+    return dict.fromkeys(MENTAL_ATTRS, value)
 
 
 def set_physical_score(score):
@@ -103,13 +99,11 @@ def set_physical_score(score):
     # Scale from category score to attribute average
     avg_value = score / CATEGORY_TO_ATTRIBUTE_SCALE
 
-    result = {}
-    for key in PHYSICAL_ATTRS:
-        result[key] = max(
-            SCORE_RANGES["attribute"][0],
-            min(SCORE_RANGES["attribute"][1], round(avg_value)),
-        )
-    return result
+    value = max(
+        SCORE_RANGES["attribute"][0],
+        min(SCORE_RANGES["attribute"][1], round(avg_value)),
+    )
+    return dict.fromkeys(PHYSICAL_ATTRS, value)
 
 
 def set_gk_score(score):
@@ -118,13 +112,11 @@ def set_gk_score(score):
     # Scale from category score to attribute average
     avg_value = score / CATEGORY_TO_ATTRIBUTE_SCALE
 
-    result = {}
-    for key in GK_ATTRS:
-        result[key] = max(
-            SCORE_RANGES["attribute"][0],
-            min(SCORE_RANGES["attribute"][1], round(avg_value)),
-        )
-    return result
+    value = max(
+        SCORE_RANGES["attribute"][0],
+        min(SCORE_RANGES["attribute"][1], round(avg_value)),
+    )
+    return dict.fromkeys(GK_ATTRS, value)
 
 
 def set_overall_score(overall_score):
@@ -1,7 +1,6 @@
-import sqlite3
 import sys
 
-from core.config import DB_PATH
+from db.connection import get_db
 
 DEMO_CLUB = "Demo Club"
 DEMO_LEAGUE = "Demo League"
@@ -14,7 +13,7 @@ def migrate_all():
     Returns:
         tuple: (success: bool, messages: list)
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     all_messages = []
 
     try:
@@ -239,7 +239,7 @@ def _render_club_selector(user, sess, current_url="/"):
     # Single club → static label
     if not is_superuser and len(clubs) == 1:
         return Span(
-            clubs[0].get("name", ""),
+            clubs[0]["name"],
             cls="club-selector-label",
         )
 
@@ -251,10 +251,10 @@ def _render_club_selector(user, sess, current_url="/"):
         )
 
     for club in clubs:
-        club_id = club.get("id")
+        club_id = club["id"]
         options.append(
             Option(
-                club.get("name", ""),
+                club["name"],
                 value=str(club_id),
                 selected=(club_id == current_club_id),
             )
@@ -1,5 +1,6 @@
 # routes/__init__.py - Route registration
 
+import atexit
 import logging
 import secrets
 
@@ -8,7 +9,7 @@ from fasthtml_hf import setup_hf_backup
 
 from core.config import *
 from core.styles import STYLE
-from db import init_db
+from db import analyze_db, close_db, init_db
 
 logger = logging.getLogger(__name__)
 
@@ -100,13 +101,31 @@ if os.environ.get("HF_TOKEN"):
     _original_upload = _hf_backup.upload
 
     def _upload_with_timestamp():
-        _original_upload()
-        try:
-            from db.settings import set_setting
+        from db.connection import checkpoint_db
 
-            set_setting("last_backup_time", datetime.now(timezone.utc).isoformat())
-        except Exception:
-            logger.warning("Failed to record backup timestamp", exc_info=True)
+        try:
+            # Fold the WAL into the main file so the uploaded copy is complete;
+            # an incomplete copy is skipped and the next backup tries again
+            try:
+                complete = checkpoint_db()
+            except Exception:
+                logger.warning(
+                    "Failed to checkpoint database before backup", exc_info=True
+                )
+                complete = False
+            if not complete:
+                logger.warning("Skipping backup: database file is missing WAL changes")
+                return
+            _original_upload()
+            try:
+                from db.settings import set_setting
+
+                set_setting("last_backup_time", datetime.now(timezone.utc).isoformat())
+            except Exception:
+                logger.warning("Failed to record backup timestamp", exc_info=True)
+        finally:
+            # The backup thread has no further use for its shared connection
+            close_db()
 
     _hf_backup.upload = _upload_with_timestamp
 
@@ -116,6 +135,10 @@ else:
 
 # Initialize database (after restore if on HF Spaces)
 init_db()
+# atexit runs handlers last-registered first: refresh the planner statistics,
+# then release the main thread's shared connection
+atexit.register(close_db)
+atexit.register(analyze_db)
 
 # Import and register all routes
 # Note: Imports must be after app initialization to avoid circular dependencies
@@ -24,11 +24,12 @@ from db.club_leagues import (
     get_leagues_for_club,
     remove_club_from_league,
 )
-from db.connection import get_db
 from db.users import (
     add_user_to_club,
     get_all_users,
     get_user_club_role,
+    remove_user_from_club,
+    update_user_club_role,
 )
 from render.common import render_head, render_navbar
 
@@ -347,15 +348,7 @@ def register_club_routes(rt, STYLE):
         if not user.get("is_superuser"):
             return RedirectResponse("/", status_code=303)
 
-        from db.connection import get_db
-
-        conn = get_db()
-        conn.execute(
-            "DELETE FROM user_clubs WHERE user_id = ? AND club_id = ?",
-            (user_id, club_id),
-        )
-        conn.commit()
-        conn.close()
+        remove_user_from_club(user_id, club_id)
 
         return RedirectResponse(f"/club/{club_id}", status_code=303)
 
@@ -381,13 +374,7 @@ def register_club_routes(rt, STYLE):
                 f"/club/{club_id}?error={error_msg.replace(' ', '+')}", status_code=303
             )
 
-        conn = get_db()
-        conn.execute(
-            "UPDATE user_clubs SET role = ? WHERE user_id = ? AND club_id = ?",
-            (role, user_id, club_id),
-        )
-        conn.commit()
-        conn.close()
+        update_user_club_role(user_id, club_id, role)
 
         return RedirectResponse(f"/club/{club_id}", status_code=303)
 
@@ -456,8 +443,8 @@ def render_clubs_list(clubs, user=None):
                     )
                 ),
                 Td(
-                    club.get("description", "")[:100]
-                    + ("..." if len(club.get("description", "")) > 100 else "")
+                    (club["description"] or "")[:100]
+                    + ("..." if len(club["description"] or "") > 100 else "")
                 ),
                 Td(
                     A(
@@ -703,8 +690,8 @@ def render_club_leagues(club_id, leagues_for_club, all_leagues, user=None):
                         )
                     ),
                     Td(
-                        league.get("description", "")[:100]
-                        + ("..." if len(league.get("description", "")) > 100 else "")
+                        (league["description"] or "")[:100]
+                        + ("..." if len(league["description"] or "") > 100 else "")
                     ),
                     Td(
                         Form(
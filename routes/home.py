@@ -17,7 +17,7 @@ def register_home_routes(rt, STYLE):
     def home(req: Request = None, sess=None):
         """Home page"""
         from db import (
-            get_match_players,
+            get_match_players_by_team,
             get_match_teams,
             get_recent_matches,
         )
@@ -39,10 +39,9 @@ def register_home_routes(rt, STYLE):
             match = data["match"]
             match_id = match["id"]
             teams = get_match_teams(match_id)
-            match_players_dict = {}
-            for team in teams:
-                team_players = get_match_players(match_id, team["id"])
-                match_players_dict[team["id"]] = team_players
+            match_players_dict = get_match_players_by_team(
+                match_id, [team["id"] for team in teams]
+            )
             next_matches_data[league_id] = {
                 "league": data["league"],
                 "match": match,
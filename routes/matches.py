@@ -19,8 +19,9 @@ from core.exceptions import DatabaseError
 from core.validation import parse_int, validate_non_empty_string, validate_url
 from db import (
     add_match_event,
-    add_match_player,
+    add_match_players,
     add_match_recording,
+    add_players_with_score,
     create_match,
     create_match_team,
     delete_match,
@@ -37,6 +38,7 @@ from db import (
     get_match,
     get_match_events,
     get_match_players,
+    get_match_players_by_team,
     get_match_recording,
     get_match_recordings,
     get_match_signup_players,
@@ -45,12 +47,13 @@ from db import (
     remove_all_match_signup_players,
     remove_match_player,
     swap_match_players,
+    unassign_match_players,
     update_match,
     update_match_player,
     update_match_team,
     update_team_captain,
 )
-from db.club_leagues import add_club_to_league, is_club_in_league
+from db.club_leagues import add_club_to_league, is_any_club_in_league
 from db.users import get_user_club_ids
 from logic import (
     allocate_match_teams,
@@ -620,9 +623,7 @@ def register_match_routes(rt, STYLE):
                     )
 
                 # Check if any of user's manager clubs are in this league
-                club_in_league = any(
-                    is_club_in_league(cid, league_id) for cid in manager_club_ids
-                )
+                club_in_league = is_any_club_in_league(manager_club_ids, league_id)
 
                 if not club_in_league:
                     # For Friendly league, automatically add the first manager club
@@ -767,13 +768,14 @@ def register_match_routes(rt, STYLE):
         events = get_match_events(match_id)
 
         # Get players grouped by team
-        match_players_dict = {}
-        match_player_ids = set()
-        for team in teams:
-            team_players = get_match_players(match_id, team["id"])
-            match_players_dict[team["id"]] = team_players
-            for player in team_players:
-                match_player_ids.add(player.get("player_id"))
+        match_players_dict = get_match_players_by_team(
+            match_id, [team["id"] for team in teams]
+        )
+        match_player_ids = {
+            player.get("player_id")
+            for team_players in match_players_dict.values()
+            for player in team_players
+        }
 
         # Get signup players (available players are those signed up but not allocated to a team)
         signup_players = get_match_signup_players(match_id)
@@ -892,13 +894,14 @@ def register_match_routes(rt, STYLE):
 
             # Get updated teams and players
             teams = get_match_teams(match_id)
-            match_players_dict = {}
-            match_player_ids = set()
-            for team in teams:
-                team_players = get_match_players(match_id, team["id"])
-                match_players_dict[team["id"]] = team_players
-                for player in team_players:
-                    match_player_ids.add(player.get("player_id"))
+            match_players_dict = get_match_players_by_team(
+                match_id, [team["id"] for team in teams]
+            )
+            match_player_ids = {
+                player.get("player_id")
+                for team_players in match_players_dict.values()
+                for player in team_players
+            }
 
             # Get signup players (available players are those signed up but not allocated to a team)
             # After allocation, available players = all signup players minus those allocated to teams
@@ -953,25 +956,19 @@ def register_match_routes(rt, STYLE):
             return RedirectResponse(f"/match/{match_id}", status_code=303)
 
         try:
-            # Get all players assigned to teams for this match
-            teams = get_match_teams(match_id)
-            for team in teams:
-                team_players = get_match_players(match_id, team["id"])
-                for mp in team_players:
-                    # Remove from team but keep in match (set team_id to NULL)
-                    update_match_player(
-                        mp["id"], team_id=None, position=None, is_starter=0
-                    )
+            # Remove every player from their team but keep them in the match
+            unassign_match_players(match_id)
 
             # Get updated teams and players
             teams = get_match_teams(match_id)
-            match_players_dict = {}
-            match_player_ids = set()
-            for team in teams:
-                team_players = get_match_players(match_id, team["id"])
-                match_players_dict[team["id"]] = team_players
-                for player in team_players:
-                    match_player_ids.add(player.get("player_id"))
+            match_players_dict = get_match_players_by_team(
+                match_id, [team["id"] for team in teams]
+            )
+            match_player_ids = {
+                player.get("player_id")
+                for team_players in match_players_dict.values()
+                for player in team_players
+            }
 
             # Get signup players (available players are those signed up but not allocated to a team)
             # After reset, all players should be back in available list (team_id = NULL)
@@ -1753,13 +1750,14 @@ def register_match_routes(rt, STYLE):
         events = get_match_events(match_id)
 
         # Get players grouped by team
-        match_players_dict = {}
-        match_player_ids = set()
-        for team in teams:
-            team_players = get_match_players(match_id, team["id"])
-            match_players_dict[team["id"]] = team_players
-            for player in team_players:
-                match_player_ids.add(player.get("player_id"))
+        match_players_dict = get_match_players_by_team(
+            match_id, [team["id"] for team in teams]
+        )
+        match_player_ids = {
+            player.get("player_id")
+            for team_players in match_players_dict.values()
+            for player in team_players
+        }
 
         # Get signup players
         signup_players = get_match_signup_players(match_id)
@@ -1809,15 +1807,19 @@ def register_match_routes(rt, STYLE):
         position = form.get("position", "").strip()
         is_starter = form.get("is_starter") == "1"
 
-        for player_id_str in player_ids:
-            player_id = int(player_id_str)
-            add_match_player(
-                match_id,
-                player_id,
-                team_id,
-                position if position else None,
-                1 if is_starter else 0,
-            )
+        add_match_players(
+            match_id,
+            [
+                (
+                    int(player_id_str),
+                    team_id,
+                    position if position else None,
+                    1 if is_starter else 0,
+                    None,
+                )
+                for player_id_str in player_ids
+            ],
+        )
 
         return RedirectResponse(f"/match/{match_id}", status_code=303)
 
@@ -1863,10 +1865,10 @@ def register_match_routes(rt, STYLE):
             return RedirectResponse("/leagues", status_code=303)
 
         teams = get_match_teams(match_id)
-        all_players = get_all_players()
-        match_players = get_match_players(match_id)
-        match_player_ids = {p["player_id"] for p in match_players}
-        available_players = [p for p in all_players if p["id"] in match_player_ids]
+        # Only players in this match can be named in its events
+        available_players = sorted(
+            get_match_players(match_id), key=lambda p: p["name"].lower()
+        )
 
         return Html(
             render_head(f"Add Event - {format_match_name(match)}", STYLE),
@@ -1901,7 +1903,7 @@ def register_match_routes(rt, STYLE):
                                 Select(
                                     Option("None", value=""),
                                     *[
-                                        Option(p["name"], value=str(p["id"]))
+                                        Option(p["name"], value=str(p["player_id"]))
                                         for p in available_players
                                     ],
                                     name="player_id",
@@ -2201,9 +2203,12 @@ def register_match_routes(rt, STYLE):
         if not total_rows or not club_id:
             return RedirectResponse(f"/match/{match_id}", status_code=303)
 
-        existing = get_match_players(match_id)
-        added_count = 0
+        existing_ids = {p["player_id"] for p in get_match_players(match_id)}
 
+        # Each selected row is either an existing player ID or a
+        # (name, score) pair to create; new players are created in one batch
+        selections = []
+        to_create = []
         for i in range(total_rows):
             # Check if this row is included (checkbox)
             include = form.get(f"include_{i}")
@@ -2217,32 +2222,31 @@ def register_match_routes(rt, STYLE):
                 continue
 
             if match_selection == "new":
-                # Create a new player with specified overall score
-                from db import add_player_with_score
-
                 score = int(form.get(f"score_{i}", 100))
-                player_id = add_player_with_score(
-                    extracted_name, club_id, overall_score=score
-                )
+                selections.append(None)
+                to_create.append((extracted_name, score))
+            else:
+                selections.append(int(match_selection))
+
+        created_ids = iter(
+            add_players_with_score(to_create, club_id) if to_create else []
+        )
+
+        new_rows = []
+        for player_id in selections:
+            if player_id is None:
+                player_id = next(created_ids)
                 if not player_id:
                     continue
-            else:
-                player_id = int(match_selection)
 
             # Skip if player already in match
-            if any(p["player_id"] == player_id for p in existing):
+            if player_id in existing_ids:
                 continue
+            existing_ids.add(player_id)
 
-            result = add_match_player(
-                match_id,
-                player_id,
-                team_id=None,
-                position=None,
-                is_starter=0,
-            )
-            if result:
-                added_count += 1
+            new_rows.append((player_id, None, None, 0, None))
 
+        added_count = add_match_players(match_id, new_rows) if new_rows else 0
         logger.info(
             f"Import confirmed: added {added_count} players to match {match_id}"
         )
@@ -2365,14 +2369,9 @@ def register_match_routes(rt, STYLE):
             except ValueError:
                 return RedirectResponse(f"/match/{match_id}", status_code=303)
 
-            # Check if player already in match
-            existing = get_match_players(match_id)
-            if any(p["player_id"] == player_id for p in existing):
-                return RedirectResponse(f"/match/{match_id}", status_code=303)
-
-            add_match_player(
-                match_id, player_id, team_id=None, position=None, is_starter=0
-            )
+            # INSERT OR IGNORE skips a player already in the match, so there is
+            # no need to load (and parse) the whole roster first
+            add_match_players(match_id, [(player_id, None, None, 0, None)])
 
         except Exception:
             traceback.print_exc()
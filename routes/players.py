@@ -26,6 +26,7 @@ from db import (
     delete_player,
     find_player_by_name_or_alias,
     get_all_players,
+    get_all_players_light,
     reset_teams,
     swap_match_players,
     swap_players,
@@ -285,12 +286,12 @@ def register_player_routes(rt, STYLE):
 
         # Check authorization
         club_ids = get_user_club_ids_from_request(req, sess)
-        players = {p["id"]: p for p in get_all_players(club_ids)}
+        players = {p["id"]: p for p in get_all_players_light(club_ids)}
         player = players.get(player_id)
         if not player:
             raise NotFoundError("player", resource_id=player_id)
 
-        if not can_user_edit(user, player.get("club_id")):
+        if not can_user_edit(user, player["club_id"]):
             raise PermissionError("edit", resource=f"player {player_id}")
 
         try:
@@ -330,12 +331,12 @@ def register_player_routes(rt, STYLE):
 
         # Check authorization
         club_ids = get_user_club_ids_from_request(req, sess)
-        players = {p["id"]: p for p in get_all_players(club_ids)}
+        players = {p["id"]: p for p in get_all_players_light(club_ids)}
         player = players.get(player_id)
         if not player:
             raise NotFoundError("player", resource_id=player_id)
 
-        if not can_user_edit(user, player.get("club_id")):
+        if not can_user_edit(user, player["club_id"]):
             raise PermissionError("edit", resource=f"player {player_id}")
 
         try:
@@ -602,13 +603,13 @@ def register_player_routes(rt, STYLE):
 
         # Check authorization
         club_ids = get_user_club_ids_from_request(req, sess)
-        players = {p["id"]: p for p in get_all_players(club_ids)}
+        players = {p["id"]: p for p in get_all_players_light(club_ids)}
         player = players.get(player_id)
 
         if not player:
             raise NotFoundError("player", resource_id=player_id)
 
-        if not can_user_delete(user, player.get("club_id")):
+        if not can_user_delete(user, player["club_id"]):
             raise PermissionError("delete", resource=f"player {player_id}")
 
         success = delete_player(player_id)
@@ -15,7 +15,7 @@ from db import (
     get_league,
     get_match,
     get_match_events,
-    get_match_players,
+    get_match_players_by_team,
     get_match_signup_players,
     get_match_teams,
     get_matches_by_league,
@@ -73,13 +73,14 @@ def register_public_routes(rt, STYLE):
             return _not_found()
 
         teams = get_match_teams(match_id)
-        match_players_dict = {}
-        match_player_ids = set()
-        for team in teams:
-            team_players = get_match_players(match_id, team["id"])
-            match_players_dict[team["id"]] = team_players
-            for player in team_players:
-                match_player_ids.add(player.get("player_id"))
+        match_players_dict = get_match_players_by_team(
+            match_id, [team["id"] for team in teams]
+        )
+        match_player_ids = {
+            player.get("player_id")
+            for team_players in match_players_dict.values()
+            for player in team_players
+        }
 
         signup_players = get_match_signup_players(match_id)
         available_signup_players = [
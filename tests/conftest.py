@@ -27,10 +27,18 @@ def temp_db(monkeypatch, temp_db_path):
     monkeypatch.setattr(core.config, "DB_PATH", temp_db_path)
     monkeypatch.setattr(db.connection, "DB_PATH", temp_db_path)
 
+    from db.clubs import clear_club_cache
     from db.connection import init_db
+    from db.leagues import clear_league_cache
 
+    # Module caches would otherwise carry rows over from the previous test's
+    # database
+    clear_club_cache()
+    clear_league_cache()
     init_db()
     yield temp_db_path
+    clear_club_cache()
+    clear_league_cache()
 
 
 @pytest.fixture
@@ -232,7 +232,7 @@ class TestGetCurrentUser:
 class TestGetUserAccessibleClubIds:
     """Tests for get_user_accessible_club_ids function"""
 
-    @patch("core.auth.get_all_clubs")
+    @patch("core.auth.iter_all_clubs")
     def test_superuser_gets_all_clubs(self, mock_get_clubs):
         """Test that superuser gets all clubs"""
         mock_get_clubs.return_value = [
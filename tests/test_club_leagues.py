@@ -7,6 +7,7 @@ from db.club_leagues import (
     get_clubs_in_league,
     get_league_ids_for_clubs,
     get_leagues_for_club,
+    is_any_club_in_league,
     is_club_in_league,
     remove_club_from_league,
 )
@@ -249,6 +250,22 @@ class TestIsClubInLeague:
         )
 
 
+class TestIsAnyClubInLeague:
+    """Tests for is_any_club_in_league function"""
+
+    def test_is_any_club_in_league(self, temp_db, sample_clubs, sample_leagues):
+        """Test that one member club is enough"""
+        add_club_to_league(sample_clubs["club2_id"], sample_leagues["league1_id"])
+
+        club_ids = [sample_clubs["club1_id"], sample_clubs["club2_id"]]
+        assert is_any_club_in_league(club_ids, sample_leagues["league1_id"]) is True
+        assert is_any_club_in_league(club_ids, sample_leagues["league2_id"]) is False
+
+    def test_is_any_club_in_league_empty(self, temp_db, sample_leagues):
+        """Test that no clubs means no membership"""
+        assert is_any_club_in_league([], sample_leagues["league1_id"]) is False
+
+
 class TestGetLeagueIdsForClubs:
     """Tests for get_league_ids_for_clubs function"""
 
@@ -313,6 +330,15 @@ class TestGetLeagueIdsForClubs:
         )
         assert league_ids == []
 
+    def test_get_league_ids_for_many_clubs(self, temp_db, sample_clubs, sample_leagues):
+        """Test a club list longer than SQLite's bound-parameter limit"""
+        add_club_to_league(sample_clubs["club1_id"], sample_leagues["league1_id"])
+
+        club_ids = [sample_clubs["club1_id"]] + list(range(100000, 140000))
+        league_ids = get_league_ids_for_clubs(club_ids)
+
+        assert league_ids == [sample_leagues["league1_id"]]
+
 
 class TestLeagueFiltering:
     """Tests for league filtering by club participation"""
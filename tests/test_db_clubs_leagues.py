@@ -2,12 +2,16 @@
 
 from unittest.mock import patch
 
+import pytest
+
+from core.exceptions import DatabaseError
 from db.clubs import (
     create_club,
     delete_club,
     get_all_clubs,
     get_club,
     get_club_by_name,
+    iter_all_clubs,
     update_club,
 )
 from db.leagues import (
@@ -67,6 +71,50 @@ class TestGetClub:
         assert result is None
 
 
+class TestClubCache:
+    """Tests for the get_club / get_club_by_name cache"""
+
+    def test_repeat_lookup_skips_database(self, temp_db):
+        """Test that a cached club is served without querying"""
+        club_id = create_club("Cached Club")
+        get_club(club_id)
+
+        with patch("db.clubs.get_db") as mock_get_db:
+            club = get_club(club_id)
+            by_name = get_club_by_name("Cached Club")
+
+        mock_get_db.assert_not_called()
+        assert club["name"] == "Cached Club"
+        assert by_name["id"] == club_id
+
+    def test_returned_dict_is_a_copy(self, temp_db):
+        """Test that mutating a result does not change the cache"""
+        club_id = create_club("Cached Club")
+        get_club(club_id)["name"] = "Mutated"
+
+        assert get_club(club_id)["name"] == "Cached Club"
+
+    def test_update_invalidates(self, temp_db):
+        """Test that update_club drops stale entries"""
+        club_id = create_club("Old Name")
+        get_club(club_id)
+        get_club_by_name("Old Name")
+
+        update_club(club_id, name="New Name")
+
+        assert get_club(club_id)["name"] == "New Name"
+        assert get_club_by_name("Old Name") is None
+
+    def test_delete_invalidates(self, temp_db):
+        """Test that delete_club drops the cached club"""
+        club_id = create_club("Doomed Club")
+        get_club(club_id)
+
+        delete_club(club_id)
+
+        assert get_club(club_id) is None
+
+
 class TestGetClubByName:
     """Tests for get_club_by_name function"""
 
@@ -109,6 +157,20 @@ class TestGetAllClubs:
         assert "Club 2" in names
 
 
+class TestIterAllClubs:
+    """Tests for iter_all_clubs function"""
+
+    def test_iter_all_clubs_matches_list(self, temp_db):
+        """Test that iteration yields the same clubs as get_all_clubs"""
+        create_club("Club 1")
+        create_club("Club 2")
+
+        clubs = iter_all_clubs()
+
+        assert not isinstance(clubs, list)
+        assert [c["id"] for c in clubs] == [c["id"] for c in get_all_clubs()]
+
+
 class TestUpdateClub:
     """Tests for update_club function"""
 
@@ -233,22 +295,22 @@ class TestGetAllLeagues:
 
         assert result == []
 
-    @patch("db.leagues.get_league_ids_for_clubs")
-    def test_get_all_leagues_with_club_filter(self, mock_get_league_ids, temp_db):
+    def test_get_all_leagues_with_club_filter(self, temp_db):
         """Test getting leagues filtered by club_ids"""
+        from db.club_leagues import add_club_to_league
 
-        mock_get_league_ids.return_value = [1, 2]
-
-        # Create leagues
+        club1_id = create_club("Club 1")
+        club2_id = create_club("Club 2")
         league1_id = create_league("League 1")
         league2_id = create_league("League 2")
+        create_league("League 3")
+        add_club_to_league(club1_id, league1_id)
+        add_club_to_league(club2_id, league1_id)
+        add_club_to_league(club2_id, league2_id)
 
-        # Mock the league IDs to match
-        mock_get_league_ids.return_value = [league1_id, league2_id]
-
-        result = get_all_leagues(club_ids=[1])
+        result = get_all_leagues(club_ids=[club1_id, club2_id])
 
-        assert len(result) >= 0  # May be empty if clubs not in leagues
+        assert {league["id"] for league in result} == {league1_id, league2_id}
 
 
 class TestGetLeague:
@@ -348,6 +410,49 @@ class TestGetLeague:
         assert league is None
 
 
+class TestLeagueCache:
+    """Tests for the league cache"""
+
+    def test_repeat_lookup_skips_database(self, temp_db):
+        """Test that cached leagues are served without querying"""
+        league_id = create_league("Cached League")
+        get_league(league_id)
+        get_all_leagues()
+
+        with patch("db.leagues.get_db") as mock_get_db:
+            league = get_league(league_id)
+            leagues = get_all_leagues()
+
+        mock_get_db.assert_not_called()
+        assert league["name"] == "Cached League"
+        assert [lg["id"] for lg in leagues] == [league_id]
+
+    def test_returned_dict_is_a_copy(self, temp_db):
+        """Test that mutating a result does not change the cache"""
+        league_id = create_league("Cached League")
+        get_league(league_id)["name"] = "Mutated"
+        get_all_leagues()[0]["name"] = "Mutated"
+
+        assert get_league(league_id)["name"] == "Cached League"
+        assert get_all_leagues()[0]["name"] == "Cached League"
+
+    def test_writes_invalidate(self, temp_db):
+        """Test that create, update and delete drop stale entries"""
+        league_id = create_league("Old Name")
+        get_league(league_id)
+        get_all_leagues()
+
+        update_league(league_id, name="New Name")
+        assert get_league(league_id)["name"] == "New Name"
+
+        other_id = create_league("Other")
+        assert {lg["id"] for lg in get_all_leagues()} == {league_id, other_id}
+
+        delete_league(league_id)
+        assert get_league(league_id) is None
+        assert [lg["id"] for lg in get_all_leagues()] == [other_id]
+
+
 class TestGetOrCreateFriendlyLeague:
     """Tests for get_or_create_friendly_league function"""
 
@@ -391,6 +496,45 @@ class TestGetOrCreateFriendlyLeague:
         assert isinstance(result, int)
         mock_add_club.assert_called_once_with(club_id, result)
 
+    def test_repeat_call_keeps_single_membership(self, temp_db):
+        """Test that calling twice reuses the league and the membership"""
+        from db.club_leagues import get_clubs_in_league
+        from db.clubs import create_club
+
+        club_id = create_club("Test Club")
+
+        first = get_or_create_friendly_league(club_id=club_id)
+        second = get_or_create_friendly_league(club_id=club_id)
+
+        assert first == second
+        assert [club["id"] for club in get_clubs_in_league(first)] == [club_id]
+
+    @patch("db.leagues.add_club_to_league")
+    def test_rolled_back_outer_transaction_is_not_cached(self, mock_add_club, temp_db):
+        """Test a Friendly league created in a rolled-back outer block isn't cached"""
+        from db.error_handling import db_transaction
+
+        with pytest.raises(DatabaseError):
+            with db_transaction("outer"):
+                get_or_create_friendly_league(club_id=1)
+                raise ValueError("outer block fails")
+
+        assert [lg for lg in get_all_leagues() if lg["name"] == "Friendly"] == []
+        league_id = get_or_create_friendly_league(club_id=1)
+        assert get_league(league_id)["name"] == "Friendly"
+
+    def test_database_error_is_wrapped(self, temp_db):
+        """Test that a failing lookup raises DatabaseError and leaves no transaction"""
+        from db.connection import get_db
+
+        conn = get_db()
+        conn.execute("DROP TABLE leagues")
+        conn.commit()
+
+        with pytest.raises(DatabaseError):
+            get_or_create_friendly_league(club_id=1)
+        assert not get_db().in_transaction
+
 
 class TestCreateLeague:
     """Tests for create_league function"""
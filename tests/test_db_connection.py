@@ -1,8 +1,18 @@
 """Unit tests for database connection and initialization"""
 
+import os
 import sqlite3
+import threading
+from unittest.mock import Mock
 
-from db.connection import get_db
+from db.connection import (
+    analyze_db,
+    checkpoint_db,
+    close_db,
+    get_db,
+    init_db,
+    optimize_db,
+)
 
 
 class TestInitDb:
@@ -112,6 +122,59 @@ class TestInitDb:
         finally:
             conn.close()
 
+    def test_init_db_creates_club_leagues_league_index(self, temp_db):
+        """Test that club_leagues is indexed for lookups by league"""
+        conn = get_db()
+        try:
+            indexes = [
+                row[1] for row in conn.execute("PRAGMA index_list(club_leagues)")
+            ]
+
+            assert "idx_club_leagues_league" in indexes
+
+        finally:
+            conn.close()
+
+    def test_init_db_creates_lookup_indexes(self, temp_db):
+        """Test that child tables are indexed on their lookup columns"""
+        expected = {
+            "user_clubs": "idx_user_clubs_club",
+            "players": "idx_players_club",
+            "match_players": "idx_match_players_player",
+            "match_events": "idx_match_events_match",
+            "match_recordings": "idx_match_recordings_match",
+        }
+        conn = get_db()
+        try:
+            for table, index in expected.items():
+                indexes = [
+                    row[1] for row in conn.execute(f"PRAGMA index_list({table})")
+                ]
+                assert index in indexes
+
+        finally:
+            conn.close()
+
+    def test_init_db_creates_match_date_indexes(self, temp_db):
+        """Test that newest-first match lookups are served by an index"""
+        conn = get_db()
+        try:
+            indexes = [row[1] for row in conn.execute("PRAGMA index_list(matches)")]
+            assert "idx_matches_league_date" in indexes
+            assert "idx_matches_date" in indexes
+
+            plan = " ".join(
+                row[3]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM matches "
+                    "ORDER BY date DESC, start_time DESC LIMIT 1"
+                )
+            )
+            assert "TEMP B-TREE" not in plan
+
+        finally:
+            conn.close()
+
     def test_init_db_creates_foreign_keys(self, temp_db):
         """Test that foreign key constraints are created"""
         conn = get_db()
@@ -174,3 +237,204 @@ class TestGetDb:
 
         finally:
             conn.close()
+
+
+class TestSharedConnection:
+    """Tests for the per-thread connection reused by get_db"""
+
+    def test_get_db_reuses_connection_after_close(self, temp_db):
+        """Test that close() keeps the thread's connection open for reuse"""
+        conn = get_db()
+        conn.close()
+
+        again = get_db()
+        assert again is conn
+        assert again.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_close_discards_uncommitted_changes(self, temp_db):
+        """Test that close() rolls back like a real close would"""
+        conn = get_db()
+        conn.execute("INSERT INTO clubs (name) VALUES ('Uncommitted')")
+        conn.close()
+
+        row = (
+            get_db()
+            .execute("SELECT 1 FROM clubs WHERE name = 'Uncommitted'")
+            .fetchone()
+        )
+        assert row is None
+
+    def test_get_db_enables_wal(self, temp_db):
+        """Test that connections are opened in WAL mode"""
+        mode = get_db().execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_get_db_enables_mmap(self, temp_db):
+        """Test that connections read through memory-mapped I/O"""
+        size = get_db().execute("PRAGMA mmap_size").fetchone()[0]
+
+        assert size == 268435456
+
+    def test_get_db_connection_per_thread(self, temp_db):
+        """Test that each thread gets its own connection"""
+        main_conn = get_db()
+        other = []
+
+        def worker():
+            other.append(get_db())
+            close_db()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_conn
+
+    def test_close_db_opens_fresh_connection(self, temp_db):
+        """Test that close_db() really closes the thread's connection"""
+        conn = get_db()
+        close_db()
+
+        assert get_db() is not conn
+
+
+class TestPlannerStatistics:
+    """Tests for analyze_db and optimize_db"""
+
+    def test_analyze_db_writes_statistics(self, temp_db):
+        """Test that analyze_db populates sqlite_stat1"""
+        conn = get_db()
+        conn.execute("INSERT INTO clubs (name) VALUES ('Stats Club')")
+        conn.commit()
+
+        analyze_db()
+
+        tables = {row[0] for row in get_db().execute("SELECT tbl FROM sqlite_stat1")}
+        assert "clubs" in tables
+
+    @staticmethod
+    def _has_statistics():
+        return (
+            get_db()
+            .execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            .fetchone()
+            is not None
+        )
+
+    def test_init_db_skips_empty_database(self, temp_db):
+        """Test that init_db records no statistics for empty tables"""
+        assert not self._has_statistics()
+
+    def test_init_db_analyzes_unanalyzed_data(self, temp_db):
+        """Test that init_db analyzes an existing database without statistics"""
+        conn = get_db()
+        conn.execute("INSERT INTO players (name) VALUES ('Stats Player')")
+        conn.commit()
+
+        init_db()
+
+        assert self._has_statistics()
+
+    def test_analyze_db_refreshes_statistics(self, temp_db):
+        """Test that analyze_db updates sqlite_stat1 after rows change"""
+        conn = get_db()
+        conn.execute("INSERT INTO clubs (name) VALUES ('Stats Club')")
+        conn.commit()
+        analyze_db()
+        conn.executemany(
+            "INSERT INTO clubs (name) VALUES (?)",
+            [(f"Club {i}",) for i in range(20)],
+        )
+        conn.commit()
+
+        analyze_db()
+
+        assert self._club_row_estimate() == 21
+
+    def test_optimize_db_reanalyzes_grown_table(self, temp_db):
+        """Test that optimize_db refreshes a table this connection saw grow"""
+        conn = get_db()
+        conn.execute("INSERT INTO players (name, club_id) VALUES ('Stats Player', 1)")
+        conn.commit()
+        analyze_db()
+        conn.executemany(
+            "INSERT INTO players (name, club_id) VALUES (?, 1)",
+            [(f"Player {i}",) for i in range(200)],
+        )
+        conn.commit()
+        conn.execute("SELECT id FROM players WHERE club_id = 1").fetchall()
+
+        optimize_db()
+
+        stat = conn.execute(
+            "SELECT stat FROM sqlite_stat1 WHERE idx = 'idx_players_club'"
+        ).fetchone()
+        assert int(stat["stat"].split()[0]) > 1
+
+    @staticmethod
+    def _club_row_estimate():
+        stat = (
+            get_db()
+            .execute("SELECT stat FROM sqlite_stat1 WHERE tbl = 'clubs'")
+            .fetchone()
+        )
+        return int(stat["stat"].split()[0])
+
+
+class TestCheckpointDb:
+    """Tests for checkpoint_db function"""
+
+    def test_checkpoint_folds_wal_into_database(self, temp_db):
+        """Test that a checkpoint empties the WAL file"""
+        conn = get_db()
+        conn.execute("INSERT INTO clubs (name) VALUES ('Checkpoint Club')")
+        conn.commit()
+
+        assert checkpoint_db() is True
+        assert os.path.getsize(temp_db + "-wal") == 0
+
+    def test_checkpoint_reports_incomplete(self, temp_db, monkeypatch):
+        """Test that a busy or partial checkpoint is retried and reported"""
+        import db.connection
+
+        conn = Mock()
+        conn.execute.return_value.fetchone.return_value = (1, 10, 4)
+        monkeypatch.setattr(db.connection, "get_db", lambda: conn)
+        monkeypatch.setattr(db.connection, "_CHECKPOINT_RETRY_DELAY", 0)
+
+        assert checkpoint_db() is False
+        assert conn.execute.call_count == db.connection._CHECKPOINT_ATTEMPTS
+
+
+class TestInMemoryDatabase:
+    """Tests for running against a shared in-memory database"""
+
+    def test_memory_db_shared_across_threads(self, monkeypatch):
+        """Test that a memory URI survives between connections and threads"""
+        import core.config
+        import db.connection
+
+        uri = "file:test_shared_memory?mode=memory&cache=shared"
+        monkeypatch.setattr(core.config, "DB_PATH", uri)
+        monkeypatch.setattr(db.connection, "DB_PATH", uri)
+        monkeypatch.setattr(db.connection, "_memory_anchor", None)
+
+        db.connection.init_db()
+        conn = get_db()
+        conn.execute("INSERT INTO clubs (name) VALUES ('Memory Club')")
+        conn.commit()
+        close_db()
+
+        names = []
+
+        def worker():
+            names.extend(row[0] for row in get_db().execute("SELECT name FROM clubs"))
+            close_db()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert names == ["Memory Club"]
+        db.connection._memory_anchor[1].close()
@@ -1,6 +1,7 @@
 """Unit tests for db/error_handling.py functions"""
 
 import sqlite3
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -71,6 +72,86 @@ class TestDbTransaction:
         mock_conn.rollback.assert_called_once()
         mock_conn.close.assert_called_once()
 
+    @patch("db.error_handling.get_db")
+    def test_db_transaction_serializes_writers(self, mock_get_db):
+        """Test a second thread waits until the first transaction finishes"""
+        mock_get_db.return_value = Mock()
+        entered = threading.Event()
+
+        def writer():
+            with db_transaction("other_writer"):
+                entered.set()
+
+        with db_transaction("test_operation"):
+            # Nested transactions on the same thread don't block
+            with db_transaction("nested_operation"):
+                pass
+            thread = threading.Thread(target=writer)
+            thread.start()
+            assert not entered.wait(0.1)
+
+        thread.join(timeout=5)
+        assert entered.is_set()
+
+
+class TestNestedDbTransaction:
+    """Tests for db_transaction blocks nested on one shared connection"""
+
+    @staticmethod
+    def _club_names():
+        from db.connection import get_db
+
+        return {row[0] for row in get_db().execute("SELECT name FROM clubs")}
+
+    def test_nested_commit_deferred_to_outer_block(self, temp_db):
+        """Test an inner commit does not commit the outer block's work"""
+        with pytest.raises(DatabaseError):
+            with db_transaction("outer") as conn:
+                conn.execute("INSERT INTO clubs (name) VALUES ('Outer')")
+                with db_transaction("inner") as inner:
+                    inner.execute("INSERT INTO clubs (name) VALUES ('Inner')")
+                    inner.commit()
+                raise ValueError("outer fails after inner commit")
+
+        assert self._club_names() == set()
+
+    def test_reader_close_keeps_outer_transaction(self, temp_db):
+        """Test a helper's close() inside a block does not roll it back"""
+        from db.connection import get_db
+
+        with db_transaction("outer") as conn:
+            conn.execute("INSERT INTO clubs (name) VALUES ('Outer')")
+            reader = get_db()
+            reader.execute("SELECT 1").fetchone()
+            reader.close()
+            conn.commit()
+
+        assert self._club_names() == {"Outer"}
+
+    def test_nested_error_rolls_back_at_outer_block(self, temp_db):
+        """Test a nested failure propagates once and the outer block rolls back"""
+        with pytest.raises(IntegrityError):
+            with db_transaction("outer") as conn:
+                conn.execute("INSERT INTO clubs (name) VALUES ('Outer')")
+                with db_transaction("inner") as inner:
+                    inner.execute("INSERT INTO clubs (name) VALUES ('Outer')")
+
+        assert self._club_names() == set()
+
+    def test_after_transaction_waits_for_outermost_block(self, temp_db):
+        """Test queued callbacks run once the outermost block has ended"""
+        from db.connection import after_transaction
+
+        calls = []
+        with db_transaction("outer"):
+            with db_transaction("inner"):
+                after_transaction(lambda: calls.append("done"))
+            assert calls == []
+        assert calls == ["done"]
+
+        after_transaction(lambda: calls.append("now"))
+        assert calls == ["done", "now"]
+
 
 class TestHandleDbOperation:
     """Tests for handle_db_operation decorator"""
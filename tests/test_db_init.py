@@ -0,0 +1,27 @@
+"""Unit tests for the db package re-exports"""
+
+import db
+
+
+class TestDbExports:
+    """Tests for the db package __all__ list"""
+
+    def test_all_has_no_duplicates(self):
+        """Test that every name is listed once"""
+        assert len(db.__all__) == len(set(db.__all__))
+
+    def test_all_names_resolve(self):
+        """Test that every listed name is importable from db"""
+        missing = [name for name in db.__all__ if not hasattr(db, name)]
+        assert missing == []
+
+    def test_public_functions_are_listed(self):
+        """Test that every function re-exported by db is listed in __all__"""
+        exported = {
+            name
+            for name, value in vars(db).items()
+            if callable(value)
+            and not name.startswith("_")
+            and getattr(value, "__module__", "").startswith("db.")
+        }
+        assert exported - set(db.__all__) == set()
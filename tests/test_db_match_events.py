@@ -4,7 +4,13 @@ import pytest
 
 from db.clubs import create_club
 from db.leagues import create_league
-from db.match_events import add_match_event, delete_match_event, get_match_events
+from db.match_events import (
+    add_match_event,
+    add_match_events,
+    delete_match_event,
+    get_match_events,
+    iter_match_events,
+)
 from db.match_teams import create_match_team
 from db.matches import create_match
 from db.players import add_player
@@ -102,6 +108,22 @@ class TestGetMatchEvents:
         assert minutes == [10, 20, 30]
 
 
+class TestIterMatchEvents:
+    """Tests for iter_match_events function"""
+
+    def test_iter_match_events(self, temp_db, sample_match, sample_team_and_player):
+        """Test that the generator yields the same rows as get_match_events"""
+        add_match_event(sample_match, "goal", minute=30)
+        add_match_event(
+            sample_match, "assist", sample_team_and_player["player_id"], minute=10
+        )
+
+        rows = iter_match_events(sample_match)
+
+        assert not isinstance(rows, list)
+        assert [dict(row) for row in rows] == get_match_events(sample_match)
+
+
 class TestAddMatchEvent:
     """Tests for add_match_event function"""
 
@@ -155,6 +177,33 @@ class TestAddMatchEvent:
         assert events[0]["description"] == "Player substitution"
 
 
+class TestAddMatchEvents:
+    """Tests for add_match_events function"""
+
+    def test_add_match_events(self, temp_db, sample_match, sample_team_and_player):
+        """Test adding several events at once"""
+        player_id = sample_team_and_player["player_id"]
+        team_id = sample_team_and_player["team_id"]
+
+        added = add_match_events(
+            sample_match,
+            [
+                ("goal", player_id, team_id, 30, ""),
+                ("yellow_card", player_id, team_id, 5, "Late tackle"),
+            ],
+        )
+
+        assert added == 2
+        events = get_match_events(sample_match)
+        assert [e["event_type"] for e in events] == ["yellow_card", "goal"]
+        assert events[0]["description"] == "Late tackle"
+
+    def test_add_match_events_empty(self, temp_db, sample_match):
+        """Test that an empty batch adds nothing"""
+        assert add_match_events(sample_match, []) == 0
+        assert get_match_events(sample_match) == []
+
+
 class TestDeleteMatchEvent:
     """Tests for delete_match_event function"""
 
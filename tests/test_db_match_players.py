@@ -7,11 +7,14 @@ from db.connection import get_db
 from db.leagues import create_league
 from db.match_players import (
     add_match_player,
+    add_match_players,
     get_match_players,
+    get_match_players_by_team,
     get_match_signup_players,
     remove_all_match_signup_players,
     remove_match_player,
     swap_match_players,
+    unassign_match_players,
     update_match_player,
 )
 from db.match_teams import create_match_team
@@ -99,6 +102,46 @@ class TestGetMatchPlayers:
         assert result == []
 
 
+class TestGetMatchPlayersByTeam:
+    """Tests for get_match_players_by_team function"""
+
+    def test_groups_match_per_team_lookups(
+        self, temp_db, sample_match, sample_players, sample_teams
+    ):
+        """Test that grouping matches per-team get_match_players calls"""
+        club_id = sample_players["club_id"]
+        player3_id = add_player("Player 3", club_id)
+        signup_id = add_player("Signup", club_id)
+        add_match_player(
+            sample_match, sample_players["player1_id"], sample_teams["team1_id"]
+        )
+        add_match_player(
+            sample_match,
+            sample_players["player2_id"],
+            sample_teams["team1_id"],
+            is_starter=1,
+        )
+        add_match_player(sample_match, player3_id, sample_teams["team2_id"])
+        add_match_player(sample_match, signup_id)
+        team_ids = [sample_teams["team1_id"], sample_teams["team2_id"]]
+
+        result = get_match_players_by_team(sample_match, team_ids)
+
+        assert result == {
+            team_id: get_match_players(sample_match, team_id) for team_id in team_ids
+        }
+        assert [p["player_id"] for p in result[sample_teams["team1_id"]]] == [
+            sample_players["player2_id"],
+            sample_players["player1_id"],
+        ]
+
+    def test_team_without_players(self, temp_db, sample_match, sample_teams):
+        """Test that every requested team gets a list"""
+        result = get_match_players_by_team(sample_match, [sample_teams["team1_id"]])
+
+        assert result == {sample_teams["team1_id"]: []}
+
+
 class TestGetMatchSignupPlayers:
     """Tests for get_match_signup_players function"""
 
@@ -163,6 +206,51 @@ class TestAddMatchPlayer:
         assert match_player_id is not None
 
 
+class TestAddMatchPlayers:
+    """Tests for add_match_players function"""
+
+    def test_add_match_players_batch(
+        self, temp_db, sample_match, sample_players, sample_teams
+    ):
+        """Test adding several players in one call"""
+        added = add_match_players(
+            sample_match,
+            [
+                (sample_players["player1_id"], sample_teams["team1_id"], "GK", 1, "GK"),
+                (sample_players["player2_id"], None, None, 0, None),
+            ],
+        )
+
+        assert added == 2
+        team_players = get_match_players(sample_match, team_id=sample_teams["team1_id"])
+        assert len(team_players) == 1
+        assert team_players[0]["tactical_position"] == "GK"
+        assert team_players[0]["is_starter"] == 1
+        signups = get_match_signup_players(sample_match)
+        assert [p["player_id"] for p in signups] == [sample_players["player2_id"]]
+
+    def test_add_match_players_skips_existing(
+        self, temp_db, sample_match, sample_players
+    ):
+        """Test that players already in the match don't abort the batch"""
+        add_match_player(sample_match, sample_players["player1_id"])
+
+        added = add_match_players(
+            sample_match,
+            [
+                (sample_players["player1_id"], None, None, 0, None),
+                (sample_players["player2_id"], None, None, 0, None),
+            ],
+        )
+
+        assert added == 1
+        assert len(get_match_players(sample_match)) == 2
+
+    def test_add_match_players_empty(self, temp_db, sample_match):
+        """Test adding an empty batch"""
+        assert add_match_players(sample_match, []) == 0
+
+
 class TestUpdateMatchPlayer:
     """Tests for update_match_player function"""
 
@@ -304,6 +392,47 @@ class TestRemoveAllMatchSignupPlayers:
         assert len(signup_players) == 0
 
 
+class TestUnassignMatchPlayers:
+    """Tests for unassign_match_players function"""
+
+    def test_unassign_all_teams(
+        self, temp_db, sample_match, sample_players, sample_teams
+    ):
+        """Test moving every team player back to signups"""
+        add_match_player(
+            sample_match,
+            sample_players["player1_id"],
+            sample_teams["team1_id"],
+            position="Forward",
+            is_starter=1,
+        )
+        add_match_player(
+            sample_match, sample_players["player2_id"], sample_teams["team2_id"]
+        )
+
+        assert unassign_match_players(sample_match)
+
+        signups = get_match_signup_players(sample_match)
+        assert len(signups) == 2
+        assert all(p["position"] is None and p["is_starter"] == 0 for p in signups)
+
+    def test_unassign_single_team(
+        self, temp_db, sample_match, sample_players, sample_teams
+    ):
+        """Test that only the given team is cleared"""
+        add_match_player(
+            sample_match, sample_players["player1_id"], sample_teams["team1_id"]
+        )
+        add_match_player(
+            sample_match, sample_players["player2_id"], sample_teams["team2_id"]
+        )
+
+        assert unassign_match_players(sample_match, sample_teams["team1_id"])
+
+        assert get_match_players(sample_match, sample_teams["team1_id"]) == []
+        assert len(get_match_players(sample_match, sample_teams["team2_id"])) == 1
+
+
 class TestSwapMatchPlayers:
     """Tests for swap_match_players function"""
 
@@ -351,6 +480,25 @@ class TestSwapMatchPlayers:
         assert p2["position"] == "Forward"
         assert p2["is_starter"] == 1
 
+    def test_swap_match_players_missing_player(
+        self, temp_db, sample_match, sample_players, sample_teams
+    ):
+        """Test that a missing match player leaves the other untouched"""
+        mp1_id = add_match_player(
+            sample_match,
+            sample_players["player1_id"],
+            sample_teams["team1_id"],
+            "Forward",
+            1,
+        )
+
+        assert swap_match_players(mp1_id, 99999) is False
+        assert swap_match_players(99999, mp1_id) is False
+
+        (player,) = get_match_players(sample_match)
+        assert player["team_id"] == sample_teams["team1_id"]
+        assert player["position"] == "Forward"
+
 
 class TestUpdateMatchPlayerEdgeCases:
     """Tests for update_match_player edge cases"""
@@ -79,6 +79,14 @@ class TestCreateMatchTeam:
         assert teams[0]["team_name"] == "Team B"
         assert teams[0]["jersey_color"] == "Blue"
 
+    def test_create_match_team_upsert_after_other_insert(self, temp_db, sample_match):
+        """Test upsert returns its own id, not the connection's last inserted row"""
+        team_id1 = create_match_team(sample_match, 1, "Team A", "Red")
+        team_id2 = create_match_team(sample_match, 2, "Team B", "Blue")
+
+        assert create_match_team(sample_match, 1, "Team C", "Green") == team_id1
+        assert create_match_team(sample_match, 2, "Team D", "White") == team_id2
+
     def test_create_match_team_with_should_allocate(self, temp_db, sample_match):
         """Test creating team with should_allocate flag"""
         team_id = create_match_team(sample_match, 1, "Team A", "Red", should_allocate=0)
@@ -20,6 +20,7 @@ from db.matches import (
     get_matches_by_league,
     get_next_match,
     get_next_match_by_league,
+    get_next_matches_by_all_leagues,
     get_recent_matches,
     save_match_info,
     update_match,
@@ -111,6 +112,24 @@ class TestGetMatch:
 
         assert result is None
 
+    def test_get_match_club_access(self, temp_db, sample_league, sample_club):
+        """Test the match is only returned to clubs in its league"""
+        match_id = create_match(
+            league_id=sample_league,
+            date="2024-01-15",
+            start_time="10:00:00",
+            end_time=None,
+            location="Test Field",
+            num_teams=2,
+        )
+        other_club = create_club("Other Club")
+        add_club_to_league(sample_club, sample_league)
+
+        assert get_match(match_id, [sample_club])["id"] == match_id
+        assert get_match(match_id, [other_club, sample_club])["id"] == match_id
+        assert get_match(match_id, [other_club]) is None
+        assert get_match(match_id, [])["id"] == match_id
+
 
 class TestGetMatchesByLeague:
     """Tests for get_matches_by_league function"""
@@ -237,6 +256,58 @@ class TestGetNextMatchByLeague:
         assert match["league_id"] == sample_league
 
 
+class TestGetNextMatchesByAllLeagues:
+    """Tests for get_next_matches_by_all_leagues function"""
+
+    def test_soonest_upcoming_match_per_league(self, temp_db, sample_league):
+        """Each league maps to its soonest upcoming match, as per league lookup"""
+        other_league = create_league("Other League")
+        create_league("Empty League")
+        today = date.today()
+        for league_id, days in (
+            (sample_league, -1),
+            (sample_league, 14),
+            (sample_league, 7),
+            (other_league, 3),
+        ):
+            create_match(
+                league_id=league_id,
+                date=(today + timedelta(days=days)).isoformat(),
+                start_time="10:00:00",
+                end_time=None,
+                location="Field 1",
+                num_teams=2,
+            )
+
+        result = get_next_matches_by_all_leagues()
+
+        assert set(result) == {sample_league, other_league}
+        for league_id, entry in result.items():
+            assert entry["league"]["id"] == league_id
+            assert entry["match"] == get_next_match_by_league(league_id)
+        assert (
+            result[sample_league]["match"]["date"]
+            == (today + timedelta(days=7)).isoformat()
+        )
+
+    def test_filtered_by_club_leagues(self, temp_db, sample_league, sample_club):
+        """Only leagues the clubs participate in are included"""
+        other_league = create_league("Other League")
+        add_club_to_league(sample_club, sample_league)
+        for league_id in (sample_league, other_league):
+            create_match(
+                league_id=league_id,
+                date=(date.today() + timedelta(days=7)).isoformat(),
+                start_time="10:00:00",
+                end_time=None,
+                location="Field 1",
+                num_teams=2,
+            )
+
+        assert set(get_next_matches_by_all_leagues([sample_club])) == {sample_league}
+        assert get_next_matches_by_all_leagues([]) == {}
+
+
 class TestGetLastCompletedMatch:
     """Tests for get_last_completed_match function"""
 
@@ -476,6 +547,7 @@ class TestGetMatchInfo:
 
         assert match_info is not None
         assert "time" in match_info  # Backward compatibility field
+        assert match_info["time"] == match_info["start_time"] == "10:00:00"
 
     def test_get_match_info_empty(self, temp_db):
         """With no matches created, match info is None."""
@@ -6,6 +6,8 @@ from db.clubs import create_club
 from db.connection import get_db
 from db.players import (
     add_player,
+    add_players,
+    add_players_with_score,
     delete_player,
     find_player_by_name_or_alias,
     generate_random_attrs,
@@ -13,6 +15,7 @@ from db.players import (
     generate_random_mental,
     generate_random_physical,
     get_all_players,
+    get_all_players_light,
     parse_player_attributes,
     reset_teams,
     swap_players,
@@ -20,7 +23,9 @@ from db.players import (
     update_player_height_weight,
     update_player_name,
     update_player_team,
+    update_player_teams,
 )
+from logic.scoring import calculate_overall_score
 
 
 class TestGenerateRandomAttrs:
@@ -214,6 +219,32 @@ class TestGetAllPlayers:
         assert any(p["name"] == "Player 1" for p in result)
 
 
+class TestGetAllPlayersLight:
+    """Tests for get_all_players_light function"""
+
+    def test_get_all_players_light_skips_attrs(self, temp_db):
+        """Test that only identity and team columns are returned"""
+        club_id = create_club("Test Club")
+        other_club_id = create_club("Other Club")
+        player_id = add_player("Player 1", club_id, alias="P1")
+        add_player("Player 2", other_club_id)
+
+        players = get_all_players_light([club_id])
+
+        assert len(players) == 1
+        assert players[0]["id"] == player_id
+        assert players[0]["alias"] == "P1"
+        assert players[0]["club_id"] == club_id
+        assert "technical_attrs" not in players[0].keys()
+
+    def test_get_all_players_light_all_clubs(self, temp_db):
+        """Test that no filter returns players from every club"""
+        add_player("Player 1", create_club("Club 1"))
+        add_player("Player 2", create_club("Club 2"))
+
+        assert len(get_all_players_light()) == 2
+
+
 class TestFindPlayerByNameOrAlias:
     """Tests for find_player_by_name_or_alias function"""
 
@@ -282,6 +313,90 @@ class TestAddPlayer:
 
         assert player_id is not None
 
+    def test_add_player_stores_attrs_as_json_text(self, temp_db):
+        """Test that attribute columns are stored as JSON TEXT, not BLOB"""
+        club_id = create_club("Test Club")
+        player_id = add_player("New Player", club_id=club_id)
+
+        conn = get_db()
+        row = conn.execute(
+            "SELECT typeof(technical_attrs), technical_attrs FROM players WHERE id = ?",
+            (player_id,),
+        ).fetchone()
+        conn.close()
+
+        assert row[0] == "text"
+        assert set(json.loads(row[1])) == set(generate_random_attrs())
+
+
+class TestAddPlayers:
+    """Tests for add_players function"""
+
+    def test_add_players_batch(self, temp_db):
+        """Test adding several players in one call"""
+        club_id = create_club("Test Club")
+
+        added = add_players(["Player A", "Player B"], club_id)
+
+        assert added == 2
+        players = get_all_players([club_id])
+        assert {p["name"] for p in players} == {"Player A", "Player B"}
+        assert all(len(p["technical_attrs"]) > 0 for p in players)
+
+    def test_add_players_skips_existing(self, temp_db):
+        """Test that existing names are skipped without failing the batch"""
+        club_id = create_club("Test Club")
+        add_player("Player A", club_id)
+
+        added = add_players(["Player A", "Player B"], club_id)
+
+        assert added == 1
+        assert len(get_all_players([club_id])) == 2
+
+    def test_add_players_attribute_groups(self, temp_db):
+        """Test that each batch-created player gets full groups in range"""
+        club_id = create_club("Test Club")
+
+        add_players([f"Player {i}" for i in range(5)], club_id)
+
+        for player in get_all_players([club_id]):
+            assert set(player["technical_attrs"]) == set(generate_random_attrs())
+            assert set(player["mental_attrs"]) == set(generate_random_mental())
+            assert set(player["physical_attrs"]) == set(generate_random_physical())
+            assert set(player["gk_attrs"]) == set(generate_random_gk())
+            for group in (
+                "technical_attrs",
+                "mental_attrs",
+                "physical_attrs",
+                "gk_attrs",
+            ):
+                assert all(1 <= v <= 20 for v in player[group].values())
+
+
+class TestAddPlayersWithScore:
+    """Tests for add_players_with_score function"""
+
+    def test_add_players_with_score_returns_ids_in_order(self, temp_db):
+        """Test that IDs line up with the input and duplicates map to None"""
+        club_id = create_club("Test Club")
+        add_player("Existing", club_id)
+
+        ids = add_players_with_score(
+            [("New A", 150), ("Existing", 100), ("New B", 50)], club_id
+        )
+
+        assert ids[1] is None
+        players = {p["id"]: p for p in get_all_players([club_id])}
+        assert players[ids[0]]["name"] == "New A"
+        assert players[ids[2]]["name"] == "New B"
+        assert calculate_overall_score(players[ids[0]]) > calculate_overall_score(
+            players[ids[2]]
+        )
+
+    def test_add_players_with_score_empty(self, temp_db):
+        """Test that an empty batch creates nothing"""
+        assert add_players_with_score([], create_club("Test Club")) == []
+
 
 class TestDeletePlayer:
     """Tests for delete_player function"""
@@ -348,6 +463,22 @@ class TestUpdatePlayerTeam:
         assert result["position"] == "Forward"
 
 
+class TestUpdatePlayerTeams:
+    """Tests for update_player_teams function"""
+
+    def test_update_player_teams_batch(self, temp_db):
+        """Test updating several players' teams in one call"""
+        club_id = create_club("Test Club")
+        p1 = add_player("Player 1", club_id)
+        p2 = add_player("Player 2", club_id)
+
+        assert update_player_teams([(p1, 1, "Defender"), (p2, 2, "Forward")])
+
+        players = {p["id"]: p for p in get_all_players([club_id])}
+        assert (players[p1]["team"], players[p1]["position"]) == (1, "Defender")
+        assert (players[p2]["team"], players[p2]["position"]) == (2, "Forward")
+
+
 class TestUpdatePlayerAttrs:
     """Tests for update_player_attrs function"""
 
@@ -525,6 +656,28 @@ class TestSwapPlayers:
         assert p2["team"] == "Team A"
         assert p2["position"] == "Forward"
 
+    def test_swap_players_missing_player(self, temp_db):
+        """Test that swapping with a missing player changes nothing"""
+        club_id = create_club("Test Club")
+        conn = get_db()
+        player_id = conn.execute(
+            """INSERT INTO players (name, club_id, team, position, technical_attrs, mental_attrs, physical_attrs, gk_attrs)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            ("Player 1", club_id, "Team A", "Forward", "{}", "{}", "{}", "{}"),
+        ).lastrowid
+        conn.commit()
+        conn.close()
+
+        assert swap_players(player_id, 99999) is False
+
+        conn = get_db()
+        p1 = conn.execute(
+            "SELECT team, position FROM players WHERE id = ?", (player_id,)
+        ).fetchone()
+        conn.close()
+        assert p1["team"] == "Team A"
+        assert p1["position"] == "Forward"
+
 
 class TestResetTeams:
     """Tests for reset_teams function"""
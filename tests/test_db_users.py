@@ -13,6 +13,7 @@ from db.users import (
     get_user_club_role,
     get_user_clubs,
     get_users_by_club_ids,
+    remove_user_from_club,
     update_last_login,
     update_user,
     update_user_club_role,
@@ -217,6 +218,25 @@ class TestUpdateUserClubRole:
         assert role == "manager"
 
 
+class TestRemoveUserFromClub:
+    """Tests for remove_user_from_club function"""
+
+    def test_remove_user_from_club(self, temp_db, sample_user, sample_club):
+        """Test removing a user's club membership"""
+        add_user_to_club(sample_user["user_id"], sample_club, "viewer")
+
+        result = remove_user_from_club(sample_user["user_id"], sample_club)
+
+        assert result is True
+        assert get_user_club_role(sample_user["user_id"], sample_club) is None
+
+    def test_remove_user_from_club_not_member(self, temp_db, sample_user, sample_club):
+        """Test removing a user who is not in the club"""
+        result = remove_user_from_club(sample_user["user_id"], sample_club)
+
+        assert result is False
+
+
 class TestUpdateLastLogin:
     """Tests for update_last_login function"""
 
@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from logic.import_logic import import_players, parse_signup_text
 
 
@@ -66,25 +68,31 @@ class TestParseSignupText:
 class TestImportPlayers:
     """Tests for import_players function"""
 
+    @pytest.fixture(autouse=True)
+    def mock_optimize_db(self):
+        """Keep the post-import ANALYZE away from the real database"""
+        with patch("logic.import_logic.optimize_db") as mock:
+            self.mock_optimize_db = mock
+            yield mock
+
     @patch("logic.import_logic.find_player_by_name_or_alias")
-    @patch("logic.import_logic.add_player")
-    def test_import_new_players(self, mock_add_player, mock_find_player):
+    @patch("logic.import_logic.add_players")
+    def test_import_new_players(self, mock_add_players, mock_find_player):
         """Test importing new players that don't exist"""
         mock_find_player.return_value = None
-        mock_add_player.return_value = 1
+        mock_add_players.return_value = 2
 
         text = "1. John Doe\n2. Jane Smith"
         result = import_players(text, club_id=1)
 
         assert result == 2
         assert mock_find_player.call_count == 2
-        assert mock_add_player.call_count == 2
-        mock_add_player.assert_any_call("John Doe", 1)
-        mock_add_player.assert_any_call("Jane Smith", 1)
+        mock_add_players.assert_called_once_with(["John Doe", "Jane Smith"], 1)
+        self.mock_optimize_db.assert_called_once()
 
     @patch("logic.import_logic.find_player_by_name_or_alias")
-    @patch("logic.import_logic.add_player")
-    def test_import_existing_players(self, mock_add_player, mock_find_player):
+    @patch("logic.import_logic.add_players")
+    def test_import_existing_players(self, mock_add_players, mock_find_player):
         """Test importing players that already exist"""
         mock_find_player.return_value = {"id": 1, "name": "John Doe"}
 
@@ -92,11 +100,12 @@ class TestImportPlayers:
         result = import_players(text, club_id=1)
 
         assert result == 0
-        assert mock_add_player.call_count == 0
+        assert mock_add_players.call_count == 0
+        self.mock_optimize_db.assert_not_called()
 
     @patch("logic.import_logic.find_player_by_name_or_alias")
-    @patch("logic.import_logic.add_player")
-    def test_import_mixed_new_and_existing(self, mock_add_player, mock_find_player):
+    @patch("logic.import_logic.add_players")
+    def test_import_mixed_new_and_existing(self, mock_add_players, mock_find_player):
         """Test importing mix of new and existing players"""
 
         def find_side_effect(name):
@@ -105,33 +114,32 @@ class TestImportPlayers:
             return None
 
         mock_find_player.side_effect = find_side_effect
-        mock_add_player.return_value = 1
+        mock_add_players.return_value = 1
 
         text = "1. John Doe\n2. Jane Smith"
         result = import_players(text, club_id=1)
 
         assert result == 1
-        assert mock_add_player.call_count == 1
-        mock_add_player.assert_called_once_with("Jane Smith", 1)
+        mock_add_players.assert_called_once_with(["Jane Smith"], 1)
 
     @patch("logic.import_logic.find_player_by_name_or_alias")
-    @patch("logic.import_logic.add_player")
-    def test_import_empty_text(self, mock_add_player, mock_find_player):
+    @patch("logic.import_logic.add_players")
+    def test_import_empty_text(self, mock_add_players, mock_find_player):
         """Test importing empty text"""
         result = import_players("", club_id=1)
 
         assert result == 0
         assert mock_find_player.call_count == 0
-        assert mock_add_player.call_count == 0
+        assert mock_add_players.call_count == 0
 
     @patch("logic.import_logic.find_player_by_name_or_alias")
-    @patch("logic.import_logic.add_player")
-    def test_import_with_club_id(self, mock_add_player, mock_find_player):
+    @patch("logic.import_logic.add_players")
+    def test_import_with_club_id(self, mock_add_players, mock_find_player):
         """Test that club_id is passed correctly"""
         mock_find_player.return_value = None
-        mock_add_player.return_value = 1
+        mock_add_players.return_value = 1
 
         text = "1. John Doe"
         import_players(text, club_id=5)
 
-        mock_add_player.assert_called_once_with("John Doe", 5)
+        mock_add_players.assert_called_once_with(["John Doe"], 5)